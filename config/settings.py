@@ -52,31 +52,6 @@ class Settings:
         'gender': 'Gender'
     }
     
-    # Regex patterns for data extraction
-    PATTERNS = {
-        'state': [
-            r'राज्य[:\s]*([^\n]+)',
-            r'State[:\s]*([^\n]+)',
-            r'STATE[:\s]*([^\n]+)'
-        ],
-        'vidhan_sabha': [
-            r'विधान\s*सभा[:\s]*(\d+)\s*-\s*([^\n]+)',
-            r'Assembly\s*Constituency[:\s]*(\d+)\s*-\s*([^\n]+)',
-            r'AC[:\s]*(\d+)\s*-\s*([^\n]+)'
-        ],
-        'booth': [
-            r'मतदान\s*केंद्र[:\s]*(\d+)\s*-\s*([^\n]+)',
-            r'Polling\s*Station[:\s]*(\d+)\s*-\s*([^\n]+)',
-            r'PS[:\s]*(\d+)\s*-\s*([^\n]+)'
-        ],
-        'voter': [
-            r'(\d+)\s+([A-Za-z\s]+?)\s+([A-Z]{10})\s+([A-Za-z\s]+?)\s+(Father|Husband|पिता|पति)\s+(\d+)\s+(\d+)\s+([MF])',
-            r'(\d+)\s+([^\d]+?)\s+([A-Z]{10})\s+([^\d]+?)\s+(Father|Husband)\s+(\d+)\s+(\d+)\s+([MF])',
-            r'(\d+)\s+([^\d]+?)\s+([A-Z]{10})\s+([^\d]+?)\s+(पिता|पति)\s+(\d+)\s+(\d+)\s+([MF])'
-        ],
-        'epic': r'^[A-Z]{3}\d{7}$'
-    }
-    
     # GUI settings
     GUI_SETTINGS = {
         'window_size': '800x600',
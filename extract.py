@@ -14,14 +14,10 @@ Author: Data Scrapper Intern Applicant
 """
 
 import sys
-import os
 import argparse
 import logging
 from pathlib import Path
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 # Import core modules
 from src.core.extractor import ElectoralRollExtractor
 from src.utils.file_handler import FileHandler
@@ -53,6 +49,18 @@ Examples:
         help='Output directory path where Excel file will be saved'
     )
     
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        help='Number of PDFs to process in parallel (default: number of CPUs)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-parse every PDF instead of reusing records cached by earlier runs'
+    )
+    
     parser.add_argument(
         '--gui',
         action='store_true',
@@ -89,6 +97,10 @@ def validate_arguments(args, logger):
         logger.error("Both --input and --output are required for CLI mode")
         return False
     
+    if args.workers is not None and args.workers < 1:
+        logger.error("--workers must be at least 1")
+        return False
+    
     # Validate input path
     if not FileHandler.validate_input_path(args.input):
         logger.error(f"Invalid input path or no PDF files found: {args.input}")
@@ -102,20 +114,20 @@ def validate_arguments(args, logger):
     return True
 
 
-def run_cli_mode(input_path, output_path, logger):
+def run_cli_mode(input_path, output_path, logger, workers=None, use_cache=True):
     """Run extraction in CLI mode"""
     try:
         logger.info("Starting Electoral Roll Data Extraction (CLI Mode)")
         logger.info("=" * 60)
         
         # Initialize extractor
-        extractor = ElectoralRollExtractor()
+        extractor = ElectoralRollExtractor(use_cache)
         
         # Process files
         logger.info(f"Input path: {input_path}")
         logger.info(f"Output path: {output_path}")
         
-        voters = extractor.process_directory(input_path)
+        voters = extractor.process_directory(input_path, workers)
         
         if not voters:
             logger.warning("No voter data extracted")
@@ -185,7 +197,7 @@ def main():
         if args.gui:
             run_gui_mode(logger)
         else:
-            success = run_cli_mode(args.input, args.output, logger)
+            success = run_cli_mode(args.input, args.output, logger, args.workers, not args.no_cache)
             sys.exit(0 if success else 1)
     
     except KeyboardInterrupt:
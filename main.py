@@ -7,10 +7,6 @@ Author: Data Scrapper Intern Applicant
 """
 
 import sys
-import os
-
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.cli.command_line import CommandLineInterface
 from src.utils.logger import Logger
@@ -3,87 +3,146 @@ Command line interface for the electoral roll extractor
 """
 
 import argparse
+import functools
+import logging
+import queue
 import sys
 import os
-from typing import Optional
+import threading
+from typing import Dict, Iterator, List, Optional
 
 from ..core.extractor import ElectoralRollExtractor
 from ..utils.file_handler import FileHandler
 from ..utils.logger import Logger
 
+_LEVELS = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO}
+
+# Records per batch handed to the Excel writer thread, and batches in flight
+_BATCH_SIZE = 1000
+_QUEUE_SIZE = 8
+
+# Queued instead of the None sentinel when parsing fails, so the writer
+# discards the partial workbook rather than saving it
+_ABORT = object()
+
+
+def _drain_queue(batches: queue.Queue) -> Iterator[List[Dict[str, str]]]:
+    """Yield batches from the queue until the None sentinel arrives, raising on the abort marker"""
+    while True:
+        batch = batches.get()
+        if batch is None:
+            return
+        if batch is _ABORT:
+            raise RuntimeError("Extraction aborted, partial output discarded")
+        yield batch
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser, once per process"""
+    # parse_args does not mutate the parser, so a single instance is reused
+    parser = argparse.ArgumentParser(
+        description='Extract structured voter data from PDF electoral rolls',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --input "C:\\pdfs" --output "C:\\output"
+  %(prog)s -i electoral_roll.pdf -o output_folder
+  %(prog)s roll_part1.pdf roll_part2.pdf -o output_folder
+  %(prog)s --gui
+        """
+    )
+    
+    parser.add_argument(
+        '--input', '-i',
+        type=str,
+        help='Input PDF file or directory path containing PDF files'
+    )
+    
+    # Multiple inputs are taken positionally in a single nargs action
+    # rather than by repeating an action='append' option
+    parser.add_argument(
+        'inputs',
+        nargs='*',
+        help='Additional input PDF files or directories'
+    )
+    
+    parser.add_argument(
+        '--output', '-o',
+        type=str,
+        help='Output directory path where Excel file will be saved'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        help='Number of PDFs to process in parallel (default: number of CPUs)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-parse every PDF instead of reusing records cached by earlier runs'
+    )
+    
+    parser.add_argument(
+        '--gui',
+        action='store_true',
+        help='Launch GUI mode instead of CLI'
+    )
+    
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Enable verbose logging'
+    )
+    
+    parser.add_argument(
+        '--log-file',
+        type=str,
+        help='Path to log file (optional)'
+    )
+    
+    parser.add_argument(
+        '--version',
+        action='version',
+        version='Electoral Roll Extractor v1.0.0'
+    )
+    
+    return parser
+
 
 class CommandLineInterface:
     """Command line interface for the electoral roll extractor"""
     
     def __init__(self):
         self.extractor = ElectoralRollExtractor()
-        self.logger = Logger.setup_logger(__name__)
+        # Handlers are configured in run() once the log options are parsed
+        self.logger = Logger.get_logger(__name__)
     
     def create_parser(self) -> argparse.ArgumentParser:
         """Create and configure argument parser"""
-        parser = argparse.ArgumentParser(
-            description='Extract structured voter data from PDF electoral rolls',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  %(prog)s --input "C:\\pdfs" --output "C:\\output"
-  %(prog)s -i electoral_roll.pdf -o output_folder
-  %(prog)s --gui
-            """
-        )
-        
-        parser.add_argument(
-            '--input', '-i',
-            type=str,
-            help='Input PDF file or directory path containing PDF files'
-        )
-        
-        parser.add_argument(
-            '--output', '-o',
-            type=str,
-            help='Output directory path where Excel file will be saved'
-        )
-        
-        parser.add_argument(
-            '--gui',
-            action='store_true',
-            help='Launch GUI mode instead of CLI'
-        )
-        
-        parser.add_argument(
-            '--verbose', '-v',
-            action='store_true',
-            help='Enable verbose logging'
-        )
-        
-        parser.add_argument(
-            '--log-file',
-            type=str,
-            help='Path to log file (optional)'
-        )
-        
-        parser.add_argument(
-            '--version',
-            action='version',
-            version='Electoral Roll Extractor v1.0.0'
-        )
-        
-        return parser
+        return _build_parser()
     
     def validate_arguments(self, args) -> bool:
         """Validate command line arguments"""
         if args.gui:
             return True
         
-        if not args.input or not args.output:
-            self.logger.error("Both --input and --output are required for CLI mode")
+        if not args.inputs or not args.output:
+            self.logger.error("An input path (--input or positional) and --output are required for CLI mode")
             return False
         
-        # Validate input path
-        if not FileHandler.validate_input_path(args.input):
-            self.logger.error(f"Invalid input path or no PDF files found: {args.input}")
+        if args.workers is not None and args.workers < 1:
+            self.logger.error("--workers must be at least 1")
             return False
         
+        # Validate input paths
+        for input_path in args.inputs:
+            if not FileHandler.validate_input_path(input_path):
+                self.logger.error(f"Invalid input path or no PDF files found: {input_path}")
+                return False
+        
         # Validate output path
         if not FileHandler.validate_output_path(args.output):
             self.logger.error(f"Invalid output path or insufficient permissions: {args.output}")
@@ -91,30 +150,61 @@ Examples:
         
         return True
     
-    def run_cli_mode(self, input_path: str, output_path: str) -> bool:
+    def run_cli_mode(self, input_paths: List[str], output_path: str, workers: Optional[int] = None) -> bool:
         """Run extraction in CLI mode"""
         try:
-            self.logger.info("Starting Electoral Roll Data Extraction (CLI Mode)")
-            self.logger.info("=" * 60)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Starting Electoral Roll Data Extraction (CLI Mode)")
+                self.logger.info("=" * 60)
+                self.logger.info("Input path: %s", '; '.join(input_paths))
+                self.logger.info("Output path: %s", output_path)
+            
+            # Parse PDFs on this thread while a writer thread streams finished
+            # batches into the workbook; the bounded queue applies backpressure
+            batches = queue.Queue(maxsize=_QUEUE_SIZE)
+            stream = _drain_queue(batches)
+            result = []
             
-            # Process files
-            self.logger.info(f"Input path: {input_path}")
-            self.logger.info(f"Output path: {output_path}")
+            def write_batches():
+                result.append(FileHandler.save_to_excel_streaming(stream, output_path))
+                # Keep consuming if the writer stopped early so the producer never blocks
+                try:
+                    for _ in stream:
+                        pass
+                except RuntimeError:
+                    pass
             
-            voters = self.extractor.process_directory(input_path)
+            writer = threading.Thread(target=write_batches, daemon=True)
+            writer.start()
             
-            if not voters:
+            total = 0
+            completed = False
+            try:
+                batch = []
+                for input_path in input_paths:
+                    for voter in self.extractor.iter_voters(input_path, workers):
+                        batch.append(voter)
+                        if len(batch) >= _BATCH_SIZE:
+                            batches.put(batch)
+                            total += len(batch)
+                            batch = []
+                
+                if batch:
+                    batches.put(batch)
+                    total += len(batch)
+                completed = True
+            finally:
+                batches.put(None if completed else _ABORT)
+                writer.join()
+            
+            if not total:
                 self.logger.warning("No voter data extracted")
                 return False
             
-            self.logger.info(f"Successfully extracted {len(voters)} voter records")
-            
-            # Save to Excel
-            self.logger.info("Saving data to Excel file...")
-            result = FileHandler.save_to_excel(voters, output_path)
+            self.logger.info(f"Successfully extracted {total} voter records")
             
-            if result:
-                self.logger.info(f"Data saved successfully to: {result}")
+            if result and result[0]:
+                self.logger.info(f"Data saved successfully to: {result[0]}")
                 self.logger.info("Extraction completed successfully!")
                 return True
             else:
@@ -143,14 +233,16 @@ Examples:
     
     def run(self, args=None):
         """Main entry point for CLI"""
-        parser = self.create_parser()
+        parser = _build_parser()
         args = parser.parse_args(args)
+        args.inputs = FileHandler.normalize_inputs([args.input, *args.inputs])
+        self.extractor.use_cache = not args.no_cache
         
         # Setup logging
-        log_level = 'DEBUG' if args.verbose else 'INFO'
+        log_level = _LEVELS['DEBUG' if args.verbose else 'INFO']
         self.logger = Logger.setup_logger(
             __name__, 
-            getattr(__import__('logging'), log_level),
+            log_level,
             args.log_file
         )
         
@@ -163,7 +255,7 @@ Examples:
         if args.gui:
             self.run_gui_mode()
         else:
-            success = self.run_cli_mode(args.input, args.output)
+            success = self.run_cli_mode(args.inputs, args.output, args.workers)
             sys.exit(0 if success else 1)
 
 
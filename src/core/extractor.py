@@ -6,19 +6,356 @@ Optimized for the data format shown in the Google Sheets output
 import os
 import re
 import logging
-from typing import List, Dict, Optional, Tuple
-import pdfplumber
-import pandas as pd
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Union
+
+from ..utils.file_handler import FileHandler
+from ..utils.result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
+# Output field -> column index of a voter row in the roll tables, used when a
+# table has no recognizable header row (same order as column_mappings)
+_TABLE_COLUMNS = (
+    ('serial_number', 3),
+    ('house_number', 4),
+    ('first_name', 5),
+    ('last_name', 6),
+    ('first_name_vernacular', 7),
+    ('last_name_vernacular', 8),
+    ('relation_type', 9),
+    ('relation_name_en', 10),
+    ('relation_last_name_en', 11),
+    ('relation_name_vernacular', 12),
+    ('relation_last_name_vernacular', 13),
+    ('epic_number', 14),
+    ('gender', 15),
+    ('age', 16)
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a regex once per process; unlike re's own cache this never flushes wholesale"""
+    return re.compile(pattern, flags)
+
+
+# Regexes are compiled once per process at import and shared by every
+# extractor, including the one in each worker process; that includes the
+# Devanagari header patterns, so parse_header_info never compiles anything
+
+# Enhanced patterns for extracting header information
+_HEADER_PATTERNS = {
+    'state': [
+        r'राज्य[:\s]*([^\n]{1,120})',
+        r'State[:\s]*([^\n]{1,120})',
+        r'STATE[:\s]*([^\n]{1,120})',
+        r'State\s*Code[:\s]*(\w+)',
+        r'ST_CODE[:\s]*(\w+)'
+    ],
+    'vidhan_sabha': [
+        r'विधान\s*सभा[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'Assembly\s*Constituency[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'AC[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'AC_NO[:\s]*(\d+)'
+    ],
+    'booth': [
+        r'मतदान\s*केंद्र[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'Polling\s*Station[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'PS[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'PART[:\s]*(\d+)'
+    ]
+}
+
+# The same patterns in lower case, for searching lower-cased header text
+# case-sensitively (State/STATE become one pattern). Written out rather
+# than derived with str.lower(), which would also turn escapes such as
+# \S or \W into their opposites
+_HEADER_PATTERNS_LC = {
+    'state': [
+        r'राज्य[:\s]*([^\n]{1,120})',
+        r'state[:\s]*([^\n]{1,120})',
+        r'state\s*code[:\s]*(\w+)',
+        r'st_code[:\s]*(\w+)'
+    ],
+    'vidhan_sabha': [
+        r'विधान\s*सभा[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'assembly\s*constituency[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'ac[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'ac_no[:\s]*(\d+)'
+    ],
+    'booth': [
+        r'मतदान\s*केंद्र[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'polling\s*station[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'ps[:\s]*(\d+)\s*-\s*([^\n]{1,120})',
+        r'part[:\s]*(\d+)'
+    ]
+}
+
+# Header text is lower-cased once and searched with the lower-case
+# patterns; the IGNORECASE set is only for text whose length changes
+# when lowered
+_HEADER_RES = {
+    key: tuple(_compiled(p) for p in patterns)
+    for key, patterns in _HEADER_PATTERNS_LC.items()
+}
+_HEADER_RES_CI = {
+    key: tuple(_compiled(p, re.IGNORECASE) for p in patterns)
+    for key, patterns in _HEADER_PATTERNS.items()
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _search_header_text(text: str) -> Dict[str, Tuple[str, ...]]:
+    """Map each header field found in text to its first match's groups, memoized per text"""
+    # Keyed on the whole text rather than a prefix, since rolls of one
+    # constituency share most of their header and differ in the booth line.
+    # Matches are found in the lower-cased text; values are sliced from
+    # the original so their case is kept
+    text_lc = text.lower()
+    if len(text_lc) == len(text):
+        patterns, search_text = _HEADER_RES, text_lc
+    else:
+        patterns, search_text = _HEADER_RES_CI, text
+    
+    found = {}
+    for key, key_patterns in patterns.items():
+        for pattern in key_patterns:
+            match = pattern.search(search_text)
+            if match:
+                found[key] = tuple(
+                    text[match.start(i):match.end(i)].strip()
+                    for i in range(1, pattern.groups + 1)
+                )
+                break
+    
+    return found
+
+
+# Enhanced patterns based on the actual data structure
+_VOTER_PATTERNS = (
+    # Pattern for data like: 1 1 Samsudin Ansari समसुद्दीन अंसारी F Israil Ansari इसरायल अंसारी ZIQ1306695 M 39
+    r'(\d+)[^\S\n]+(\d+)[^\S\n]+([A-Za-z]+)[^\S\n]+([A-Za-z]+)[^\S\n]+([\u0900-\u097F]+)[^\S\n]+([\u0900-\u097F]+)[^\S\n]+([FH])[^\S\n]+([A-Za-z]+)[^\S\n]+([A-Za-z]+)[^\S\n]+([\u0900-\u097F]+)[^\S\n]+([\u0900-\u097F]+)[^\S\n]+([A-Z0-9]{10})[^\S\n]+([MF])[^\S\n]+(\d+)',
+    
+    # Pattern for English-only data
+    r'(\d+)[^\S\n]+(\d+)[^\S\n]+([A-Za-z]+)[^\S\n]+([A-Za-z]+)[^\S\n]+([FH])[^\S\n]+([A-Za-z]+)[^\S\n]+([A-Za-z]+)[^\S\n]+([A-Z0-9]{10})[^\S\n]+([MF])[^\S\n]+(\d+)',
+    
+    # Fallback pattern; the name is bounded so a long non-matching
+    # line cannot backtrack through every split of it
+    r'(\d+)[^\S\n]+([^\d\s][^\d\n]{0,79}?)[^\S\n]+([A-Z0-9]{10})[^\S\n]+([MF])[^\S\n]+(\d+)'
+)
+
+def _voter_union(indexes: Iterable[int]) -> re.Pattern:
+    """Compile the voter patterns at the given indexes into one alternation named p<index>"""
+    return _compiled(
+        r'^[^\S\n]*(?:' + '|'.join(f'(?P<p{i}>{_VOTER_PATTERNS[i]})' for i in indexes) + ')',
+        re.MULTILINE
+    )
+
+
+# One alternation tried in the original order and run over the whole
+# text with finditer; every record starts a line with its serial
+# number, and whitespace is [^\S\n] (any space but a newline, NBSP
+# included) so a match never spans two lines
+_VOTER_UNION = _voter_union(range(len(_VOTER_PATTERNS)))
+
+# Pure-ASCII text can never match the Devanagari pattern, so it is scanned
+# without that alternative (str.isascii() is a flag check, not a scan)
+_VOTER_UNION_ASCII = _voter_union(
+    i for i, p in enumerate(_VOTER_PATTERNS) if '\\u' not in p
+)
+
+# Union -> alternative name -> slice of match.groups() holding its own groups
+_VOTER_SLICES = {
+    union: {
+        name: slice(index, index + _compiled(_VOTER_PATTERNS[int(name[1:])]).groups)
+        for name, index in union.groupindex.items()
+    }
+    for union in (_VOTER_UNION, _VOTER_UNION_ASCII)
+}
+
+# EPIC format: 3 letters + 7 ASCII digits, with nothing after them
+_EPIC_RE = _compiled(r'^[A-Z]{3}[0-9]{7}\Z')
+
+# Stand-in for EPIC numbers that cannot be valid when packing them 10 bytes each
+_EPIC_BLANK = ' ' * 10
+
+# Below this many values the NumPy setup costs more than matching each EPIC
+_EPIC_BATCH_MIN = 256
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pymupdf():
+    """Return the PyMuPDF module if it is installed, else None"""
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf  # Releases before 1.24 only ship the fitz name
+        except ImportError:
+            return None
+    return pymupdf
+
+
+class _MuPDFPage:
+    """Adapts a PyMuPDF page to the pdfplumber page methods used here"""
+    
+    def __init__(self, page):
+        self._page = page
+    
+    def extract_text(self) -> str:
+        return self._page.get_text("text")
+    
+    def extract_band_text(self, fraction: float) -> str:
+        rect = self._page.rect
+        return self._page.get_text("text", clip=(rect.x0, rect.y0, rect.x1, rect.y0 + rect.height * fraction))
+    
+    def extract_tables(self) -> List[List[List]]:
+        # find_tables needs PyMuPDF 1.23+
+        if not hasattr(self._page, 'find_tables'):
+            return []
+        return [table.extract() for table in self._page.find_tables().tables]
+
+
+# Fraction of the first page, from the top, searched for the roll's header
+# before falling back to the whole page
+_HEADER_BAND = 0.15
+
+
+def _header_band_text(page) -> str:
+    """Extract the text in the top band of a PyMuPDF or pdfplumber page"""
+    if isinstance(page, _MuPDFPage):
+        return page.extract_band_text(_HEADER_BAND)
+    
+    x0, top, x1, bottom = page.bbox
+    return page.crop((x0, top, x1, top + (bottom - top) * _HEADER_BAND)).extract_text()
+
+
+# PDF readers accepted by the extraction methods; None picks PyMuPDF when installed
+_PDF_BACKENDS = ('pymupdf', 'pdfplumber')
+
+
+@contextmanager
+def _open_pdf_pages(pdf_path: str, backend: Optional[str] = None,
+                    start: int = 0, stop: Optional[int] = None) -> Iterator[Iterable]:
+    """Open a PDF and yield its pages from start to stop, read with PyMuPDF when installed or pdfplumber otherwise"""
+    if backend is not None and backend not in _PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {backend}")
+    
+    pymupdf = _load_pymupdf() if backend != 'pdfplumber' else None
+    if pymupdf is None and backend == 'pymupdf':
+        raise ImportError("PyMuPDF is not installed")
+    
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            yield (_MuPDFPage(page) for page in doc.pages(start, stop))
+    else:
+        import pdfplumber
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            yield pdf.pages[start:stop]
+
+
+def _pdf_backend_id() -> str:
+    """Name and version of the reader _open_pdf_pages uses by default, for cache signatures"""
+    pymupdf = _load_pymupdf()
+    if pymupdf is not None:
+        return f"pymupdf {pymupdf.VersionBind}"
+    
+    import pdfplumber
+    
+    return f"pdfplumber {pdfplumber.__version__}"
+
+
+def _pdf_page_count(pdf_path: str) -> int:
+    """Count the pages of a PDF with the reader _open_pdf_pages would use"""
+    pymupdf = _load_pymupdf()
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    
+    import pdfplumber
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+@functools.lru_cache(maxsize=None)
+def _hyperscan_db(patterns: Tuple[str, ...]):
+    """Compile the voter line patterns into a Hyperscan database, or None if unavailable"""
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    
+    # Hyperscan takes PCRE syntax, which spells code points as \x{...}; large
+    # bounded repeats are made unbounded since they only guard re against
+    # backtracking and are slow for Hyperscan to compile (re re-checks each line)
+    expressions = []
+    for p in patterns:
+        p = _compiled(r'\\u([0-9A-Fa-f]{4})').sub(r'\\x{\1}', r'^[^\S\n]*' + p)
+        p = _compiled(r'\{0,\d+\}\??').sub('*', p)
+        expressions.append(p.encode())
+    flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    try:
+        db = hyperscan.Database()
+        db.compile(expressions=expressions, ids=list(range(len(expressions))), flags=[flags] * len(expressions))
+    except hyperscan.error as e:
+        logger.warning("Hyperscan unavailable, using re for voter lines: %s", e)
+        return None
+    return db
+
+
+# Extractor reused by every PDF handled in a worker process
+_worker_extractor = None
+
+# A PDF is only split across processes when each gets at least this many pages
+_MIN_PAGES_PER_WORKER = 16
+
+# Files submitted to the pool but not yet yielded, per worker; their records
+# wait in the parent until every file before them in path order is yielded
+_PENDING_PER_WORKER = 2
+
+
+def _get_worker_extractor(use_cache: bool) -> 'ElectoralRollExtractor':
+    """Get the extractor of this worker process"""
+    global _worker_extractor
+    if _worker_extractor is None or _worker_extractor.use_cache != use_cache:
+        _worker_extractor = ElectoralRollExtractor(use_cache)
+    return _worker_extractor
+
+
+def _process_pages(pdf_path: str, header_info: Dict[str, str], start: int, stop: int) -> List[Dict[str, str]]:
+    """Parse a range of pages of a PDF in a worker process"""
+    extractor = _get_worker_extractor(False)
+    return [voter for page_voters in extractor._iter_page_voters(pdf_path, header_info, start, stop)
+            for voter in page_voters]
+
+
+def _process_one(pdf_path: str, use_cache: bool = True,
+                 columnar: bool = False) -> Union[List[Dict[str, str]], Dict[str, List[str]]]:
+    """Process a single PDF in a worker process, returning records or columns"""
+    extractor = _get_worker_extractor(use_cache)
+    if columnar:
+        return extractor.process_single_pdf_columns(pdf_path)
+    return extractor.process_single_pdf(pdf_path)
+
+
+def process_pdf_columns(pdf_path: str, use_cache: bool = True) -> Dict[str, List[str]]:
+    """Extract a PDF's records as field -> values columns; usable as a process pool task"""
+    return _process_one(pdf_path, use_cache, columnar=True)
+
 
 class ElectoralRollExtractor:
     """Main class for extracting data from electoral roll PDFs"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.extracted_data = []
         self.supported_formats = ['.pdf']
+        # Reuse records cached on disk for PDFs unchanged since an earlier run
+        self.use_cache = use_cache
         # Column mappings from screenshot
         self.column_mappings = {
             'ST_CODE': 'st_code',
@@ -39,35 +376,34 @@ class ElectoralRollExtractor:
             'GENDER': 'gender',
             'AGE': 'age'
         }
-        
-    def extract_text_from_pdf(self, pdf_path: str) -> Optional[str]:
-        """Extract raw text from PDF using pdfplumber with table detection"""
+    
+    def extract_text_from_pdf(self, pdf_path: str, backend: Optional[str] = None) -> Optional[str]:
+        """Extract raw text from PDF; backend is 'pymupdf', 'pdfplumber' or None for the fastest installed"""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                full_text = ""
-                tables_data = []
+            with _open_pdf_pages(pdf_path, backend) as pages:
+                text_parts = []
                 
-                for page_num, page in enumerate(pdf.pages):
-                    # Try to extract tables first
-                    tables = page.extract_tables()
-                    if tables:
-                        for table in tables:
-                            tables_data.extend(table)
-                    
-                    # Also extract text for header information
+                for page in pages:
                     page_text = page.extract_text()
                     if page_text:
-                        full_text += page_text + "\n"
+                        text_parts.append(page_text)
                 
-                # Store tables data for later processing
-                self.tables_data = tables_data
-                return full_text
+                # Joined once at the end; every page keeps its trailing newline
+                return "\n".join(text_parts) + "\n" if text_parts else ""
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {str(e)}")
             return None
     
     def parse_header_info(self, text: str) -> Dict[str, str]:
         """Extract state, vidhan sabha, and booth information from header"""
+        return self._build_header_info(self._search_header(text))
+    
+    def _search_header(self, text: str) -> Dict[str, Tuple[str, ...]]:
+        """Map each header field found in text (state, vidhan_sabha, booth) to its first match's groups"""
+        return dict(_search_header_text(text))
+    
+    def _build_header_info(self, found: Dict[str, Tuple[str, ...]]) -> Dict[str, str]:
+        """Build header information from the fields found by _search_header"""
         header_info = {
             'state_name': '',
             'vidhan_sabha_name': '',
@@ -79,256 +415,398 @@ class ElectoralRollExtractor:
             'part_no': '1'     # Default from screenshot
         }
         
-        # Enhanced patterns for extracting header information
-        patterns = {
-            'state': [
-                r'राज्य[:\s]*([^\n]+)',
-                r'State[:\s]*([^\n]+)',
-                r'STATE[:\s]*([^\n]+)',
-                r'State\s*Code[:\s]*(\w+)',
-                r'ST_CODE[:\s]*(\w+)'
-            ],
-            'vidhan_sabha': [
-                r'विधान\s*सभा[:\s]*(\d+)\s*-\s*([^\n]+)',
-                r'Assembly\s*Constituency[:\s]*(\d+)\s*-\s*([^\n]+)',
-                r'AC[:\s]*(\d+)\s*-\s*([^\n]+)',
-                r'AC_NO[:\s]*(\d+)'
-            ],
-            'booth': [
-                r'मतदान\s*केंद्र[:\s]*(\d+)\s*-\s*([^\n]+)',
-                r'Polling\s*Station[:\s]*(\d+)\s*-\s*([^\n]+)',
-                r'PS[:\s]*(\d+)\s*-\s*([^\n]+)',
-                r'PART[:\s]*(\d+)'
-            ]
-        }
-        
         # Extract state code and name
-        for pattern in patterns['state']:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                value = match.group(1).strip()
-                if value.startswith('S') and len(value) <= 4:
-                    header_info['st_code'] = value
-                else:
-                    header_info['state_name'] = value
-                break
+        if 'state' in found:
+            value = found['state'][0]
+            if value.startswith('S') and len(value) <= 4:
+                header_info['st_code'] = value
+            else:
+                header_info['state_name'] = value
         
         # Extract AC number
-        for pattern in patterns['vidhan_sabha']:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                header_info['ac_no'] = match.group(1).strip()
-                if len(match.groups()) > 1:
-                    header_info['vidhan_sabha_name'] = match.group(2).strip()
-                break
+        if 'vidhan_sabha' in found:
+            groups = found['vidhan_sabha']
+            header_info['ac_no'] = groups[0]
+            header_info['vidhan_sabha_number'] = groups[0]
+            if len(groups) > 1:
+                header_info['vidhan_sabha_name'] = groups[1]
         
         # Extract part/booth number
-        for pattern in patterns['booth']:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                part_no = match.group(1).strip()
-                header_info['part_no'] = part_no
-                header_info['booth_number'] = part_no
-                if len(match.groups()) > 1:
-                    header_info['booth_name'] = match.group(2).strip()
-                break
+        if 'booth' in found:
+            groups = found['booth']
+            header_info['part_no'] = groups[0]
+            header_info['booth_number'] = groups[0]
+            if len(groups) > 1:
+                header_info['booth_name'] = groups[1]
         
         return header_info
     
-    def parse_voter_data(self, text: str, header_info: Dict[str, str]) -> List[Dict[str, str]]:
-        """Parse individual voter records from tables and text"""
-        voters = []
+    def _iter_from_tables(self, tables_data: List[List], header_info: Dict[str, str]) -> Iterator[Dict[str, str]]:
+        """Yield voter data from extracted table data"""
+        # Locate columns by the table's header row when it has one
+        header = self._find_table_header(tables_data)
+        if header:
+            header_row, col_index = header
+            positions = [(field, col_index.get(field)) for field, _ in _TABLE_COLUMNS]
+            # Footer, summary and signature tables on the page share these
+            # rows; like the text patterns, only rows that span every mapped
+            # column and start with a numeric serial number are records
+            width = max(col_index.values()) + 1
+            serial_index = col_index['serial_number']
+            rows = [
+                row for row in tables_data
+                if row and row != header_row and len(row) >= width
+                and str(row[serial_index]).strip().isdigit()
+            ]
+        else:
+            positions = _TABLE_COLUMNS
+            rows = [row for row in tables_data if row and len(row) >= 10]  # Skip incomplete rows
+        if not rows:
+            return
         
-        # First try to parse from extracted tables
-        if hasattr(self, 'tables_data') and self.tables_data:
-            voters.extend(self._parse_from_tables(header_info))
+        # Parse column by column into parallel lists; dicts are only built
+        # for the rows that pass validation
+        columns = {
+            field: [
+                str(row[index]).strip() if index is not None and len(row) > index else ''
+                for row in rows
+            ]
+            for field, index in positions
+        }
+        valid = self._validate_columns(columns['serial_number'], columns['epic_number'], columns['age'])
         
-        # If no table data, parse from text
-        if not voters:
-            voters.extend(self._parse_from_text(text, header_info))
+        st_code = header_info.get('st_code', 'S04')
+        ac_no = header_info.get('ac_no', '11')
+        part_no = header_info.get('part_no', '1')
         
-        return voters
+        for values, ok in zip(zip(*columns.values()), valid):
+            if ok:
+                yield {'st_code': st_code, 'ac_no': ac_no, 'part_no': part_no, **dict(zip(columns, values))}
     
-    def _parse_from_tables(self, header_info: Dict[str, str]) -> List[Dict[str, str]]:
-        """Parse voter data from extracted table data"""
-        voters = []
-        
-        for row in self.tables_data:
-            if not row or len(row) < 10:  # Skip incomplete rows
+    def _find_table_header(self, tables_data: List[List]) -> Optional[Tuple[List, Dict[str, int]]]:
+        """Find a header row naming the roll columns and map each field to its column index"""
+        # Headers sit at the top of a table, so only the first rows are checked
+        for row in tables_data[:5]:
+            if not row:
                 continue
             
+            col_index = {}
+            for index, cell in enumerate(row):
+                field = self.column_mappings.get(str(cell).strip().upper()) if cell is not None else None
+                if field and field not in col_index:
+                    col_index[field] = index
+            
+            if 'serial_number' in col_index and len(col_index) >= 3:
+                return row, col_index
+        
+        return None
+    
+    def _iter_from_text(self, text: str, header_info: Dict[str, str]) -> Iterator[Dict[str, str]]:
+        """Yield voter records from text when table extraction fails"""
+        voters = []
+        
+        for match in self._iter_voter_matches(text):
             try:
-                # Map table columns to our data structure
-                # Based on the screenshot format
-                voter_data = {
-                    'st_code': header_info.get('st_code', 'S04'),
-                    'ac_no': header_info.get('ac_no', '11'),
-                    'part_no': header_info.get('part_no', '1'),
-                    'serial_number': str(row[3]).strip() if len(row) > 3 else '',
-                    'house_number': str(row[4]).strip() if len(row) > 4 else '',
-                    'first_name': str(row[5]).strip() if len(row) > 5 else '',
-                    'last_name': str(row[6]).strip() if len(row) > 6 else '',
-                    'first_name_vernacular': str(row[7]).strip() if len(row) > 7 else '',
-                    'last_name_vernacular': str(row[8]).strip() if len(row) > 8 else '',
-                    'relation_type': str(row[9]).strip() if len(row) > 9 else '',
-                    'relation_name_en': str(row[10]).strip() if len(row) > 10 else '',
-                    'relation_last_name_en': str(row[11]).strip() if len(row) > 11 else '',
-                    'relation_name_vernacular': str(row[12]).strip() if len(row) > 12 else '',
-                    'relation_last_name_vernacular': str(row[13]).strip() if len(row) > 13 else '',
-                    'epic_number': str(row[14]).strip() if len(row) > 14 else '',
-                    'gender': str(row[15]).strip() if len(row) > 15 else '',
-                    'age': str(row[16]).strip() if len(row) > 16 else ''
-                }
+                kind = match.lastgroup
+                groups = match.groups()[_VOTER_SLICES[match.re][kind]]
                 
-                # Validate and clean data
-                if self._validate_voter_record(voter_data):
-                    voters.append(voter_data)
+                if kind == 'p0':  # Full pattern match
+                    voter_data = {
+                        'st_code': header_info.get('st_code', 'S04'),
+                        'ac_no': header_info.get('ac_no', '11'),
+                        'part_no': header_info.get('part_no', '1'),
+                        'serial_number': groups[0],
+                        'house_number': groups[1],
+                        'first_name': groups[2],
+                        'last_name': groups[3],
+                        'first_name_vernacular': groups[4],
+                        'last_name_vernacular': groups[5],
+                        'relation_type': groups[6],
+                        'relation_name_en': groups[7],
+                        'relation_last_name_en': groups[8],
+                        'relation_name_vernacular': groups[9],
+                        'relation_last_name_vernacular': groups[10],
+                        'epic_number': groups[11],
+                        'gender': groups[12],
+                        'age': groups[13]
+                    }
+                elif kind == 'p1':  # English-only pattern
+                    voter_data = {
+                        'st_code': header_info.get('st_code', 'S04'),
+                        'ac_no': header_info.get('ac_no', '11'),
+                        'part_no': header_info.get('part_no', '1'),
+                        'serial_number': groups[0],
+                        'house_number': groups[1],
+                        'first_name': groups[2],
+                        'last_name': groups[3],
+                        'relation_type': groups[4],
+                        'relation_name_en': groups[5],
+                        'relation_last_name_en': groups[6],
+                        'epic_number': groups[7],
+                        'gender': groups[8],
+                        'age': groups[9]
+                    }
+                else:  # Simpler pattern
+                    names = groups[1].split()
+                    voter_data = {
+                        'st_code': header_info.get('st_code', 'S04'),
+                        'ac_no': header_info.get('ac_no', '11'),
+                        'part_no': header_info.get('part_no', '1'),
+                        'serial_number': groups[0],
+                        'house_number': '1',
+                        'first_name': names[0] if names else '',
+                        'last_name': ' '.join(names[1:]),
+                        'epic_number': groups[2],
+                        'gender': groups[3],
+                        'age': groups[4]
+                    }
+                
+                voters.append(voter_data)
                     
-            except (IndexError, ValueError, AttributeError) as e:
-                logger.debug(f"Skipping row due to parsing error: {e}")
+            except (IndexError, AttributeError) as e:
+                logger.debug("Error parsing line: %s, Error: %s", match.group(0), e)
                 continue
         
-        return voters
+        # Candidates from one text are validated together in a single pass
+        valid = self._validate_columns(
+            [v['serial_number'] for v in voters],
+            [v['epic_number'] for v in voters],
+            [v['age'] for v in voters]
+        )
+        for voter, ok in zip(voters, valid):
+            if ok:
+                yield voter
     
-    def _parse_from_text(self, text: str, header_info: Dict[str, str]) -> List[Dict[str, str]]:
-        """Parse voter records from text when table extraction fails"""
-        voters = []
-        lines = text.split('\n')
+    def _iter_voter_matches(self, text: str) -> Iterator[re.Match]:
+        """Yield voter line matches, prefiltering lines with Hyperscan when it is installed"""
+        union = _VOTER_UNION_ASCII if text.isascii() else _VOTER_UNION
         
-        # Enhanced patterns based on the actual data structure
-        voter_patterns = [
-            # Pattern for data like: 1 1 Samsudin Ansari समसुद्दीन अंसारी F Israil Ansari इसरायल अंसारी ZIQ1306695 M 39
-            r'(\d+)\s+(\d+)\s+([A-Za-z]+)\s+([A-Za-z]+)\s+([\u0900-\u097F]+)\s+([\u0900-\u097F]+)\s+([FH])\s+([A-Za-z]+)\s+([A-Za-z]+)\s+([\u0900-\u097F]+)\s+([\u0900-\u097F]+)\s+([A-Z0-9]{10})\s+([MF])\s+(\d+)',
-            
-            # Pattern for English-only data
-            r'(\d+)\s+(\d+)\s+([A-Za-z]+)\s+([A-Za-z]+)\s+([FH])\s+([A-Za-z]+)\s+([A-Za-z]+)\s+([A-Z0-9]{10})\s+([MF])\s+(\d+)',
-            
-            # Fallback pattern
-            r'(\d+)\s+([^\d]+?)\s+([A-Z0-9]{10})\s+([MF])\s+(\d+)'
-        ]
+        db = _hyperscan_db(_VOTER_PATTERNS)
+        if db is None:
+            yield from union.finditer(text)
+            return
         
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 20:
-                continue
-            
-            for pattern in voter_patterns:
-                match = re.search(pattern, line)
-                if match:
-                    try:
-                        groups = match.groups()
-                        
-                        if len(groups) >= 13:  # Full pattern match
-                            voter_data = {
-                                'st_code': header_info.get('st_code', 'S04'),
-                                'ac_no': header_info.get('ac_no', '11'),
-                                'part_no': header_info.get('part_no', '1'),
-                                'serial_number': groups[0],
-                                'house_number': groups[1],
-                                'first_name': groups[2],
-                                'last_name': groups[3],
-                                'first_name_vernacular': groups[4] if len(groups) > 4 else '',
-                                'last_name_vernacular': groups[5] if len(groups) > 5 else '',
-                                'relation_type': groups[6] if len(groups) > 6 else '',
-                                'relation_name_en': groups[7] if len(groups) > 7 else '',
-                                'relation_last_name_en': groups[8] if len(groups) > 8 else '',
-                                'relation_name_vernacular': groups[9] if len(groups) > 9 else '',
-                                'relation_last_name_vernacular': groups[10] if len(groups) > 10 else '',
-                                'epic_number': groups[11] if len(groups) > 11 else '',
-                                'gender': groups[12] if len(groups) > 12 else '',
-                                'age': groups[13] if len(groups) > 13 else ''
-                            }
-                        else:  # Simpler pattern
-                            voter_data = {
-                                'st_code': header_info.get('st_code', 'S04'),
-                                'ac_no': header_info.get('ac_no', '11'),
-                                'part_no': header_info.get('part_no', '1'),
-                                'serial_number': groups[0],
-                                'house_number': '1',
-                                'first_name': groups[1].split()[0] if groups[1] else '',
-                                'last_name': ' '.join(groups[1].split()[1:]) if len(groups[1].split()) > 1 else '',
-                                'epic_number': groups[2] if len(groups) > 2 else '',
-                                'gender': groups[3] if len(groups) > 3 else '',
-                                'age': groups[4] if len(groups) > 4 else ''
-                            }
-                        
-                        if self._validate_voter_record(voter_data):
-                            voters.append(voter_data)
-                            break
-                            
-                    except (IndexError, AttributeError) as e:
-                        logger.debug(f"Error parsing line: {line}, Error: {e}")
-                        continue
-        
-        return voters
-    
-    def _validate_voter_record(self, voter_data: Dict[str, str]) -> bool:
-        """Validate a voter record"""
-        # Check for required fields
-        if not voter_data.get('serial_number'):
-            return False
+        # Hyperscan only reports where a pattern ends; collect the matching
+        # lines and let re capture the groups on just those lines
+        data = text.encode('utf-8')
+        line_starts = []
         
-        # Validate EPIC number if present
-        epic = voter_data.get('epic_number', '')
-        if epic and not self._validate_epic_number(epic):
-            return False
+        def on_match(pattern_id, start, end, flags, context):
+            line_start = data.rfind(b'\n', 0, end) + 1
+            if not line_starts or line_starts[-1] != line_start:
+                line_starts.append(line_start)
         
-        # Check age is numeric if present
-        age = voter_data.get('age', '')
-        if age and not age.isdigit():
-            return False
+        db.scan(data, match_event_handler=on_match)
+        
+        for line_start in line_starts:
+            line_end = data.find(b'\n', line_start)
+            line = data[line_start:line_end if line_end != -1 else len(data)].decode('utf-8')
+            match = union.match(line)
+            if match:
+                yield match
+    
+    def _validate_columns(self, serials: List[str], epics: List[str], ages: List[str]) -> List[bool]:
+        """Validate parallel field columns: a serial number is required, EPIC and age must be well formed if present"""
+        # A page holds a few dozen records, too few to pay for a vectorized pass
+        if len(epics) >= _EPIC_BATCH_MIN:
+            epics_ok = self.validate_epics_batch(epics)
+        else:
+            epics_ok = [_EPIC_RE.match(epic) is not None for epic in epics]
         
-        return True
+        return [
+            bool(serial) and (not epic or epic_ok) and (not age or age.isdigit())
+            for serial, epic, age, epic_ok in zip(serials, epics, ages, epics_ok)
+        ]
     
     def _validate_epic_number(self, epic: str) -> bool:
         """Validate EPIC number format"""
         if not epic or len(epic) != 10:
             return False
         
-        # EPIC format: 3 letters + 7 digits
-        pattern = r'^[A-Z]{3}\d{7}$'
-        return bool(re.match(pattern, epic))
+        return bool(_EPIC_RE.match(epic))
     
-    def process_single_pdf(self, pdf_path: str) -> List[Dict[str, str]]:
-        """Process a single PDF file"""
-        logger.info(f"Processing: {os.path.basename(pdf_path)}")
+    def validate_epics_batch(self, epics: Iterable[str]) -> List[bool]:
+        """Validate many EPIC numbers with one vectorized check over their packed ASCII bytes"""
+        try:
+            import numpy as np
+        except ImportError:
+            return [bool(epic) and _EPIC_RE.match(epic) is not None for epic in epics]
         
-        # Extract text from PDF
-        text = self.extract_text_from_pdf(pdf_path)
-        if not text:
-            logger.warning(f"No text extracted from {pdf_path}")
-            return []
+        # Values that are not 10 characters are packed as blanks, and non-ASCII
+        # characters become '?', so both fail the same checks as _EPIC_RE
+        packed = ''.join([epic if epic and len(epic) == 10 else _EPIC_BLANK for epic in epics])
+        buf = np.frombuffer(packed.encode('ascii', 'replace'), dtype=np.uint8).reshape(-1, 10)
         
-        # Parse header information
-        header_info = self.parse_header_info(text)
-        logger.debug(f"Header info: {header_info}")
+        # Unsigned wrap-around makes each range check a single comparison
+        letters = (buf[:, :3] - np.uint8(ord('A'))) < 26
+        digits = (buf[:, 3:] - np.uint8(ord('0'))) < 10
+        return (letters.all(axis=1) & digits.all(axis=1)).tolist()
+    
+    def iter_pdf_voters(self, pdf_path: str, workers: int = 1) -> Iterator[Dict[str, str]]:
+        """Yield voter records from a single PDF file, one page at a time"""
+        logger.info("Processing: %s", os.path.basename(pdf_path))
         
-        # Parse voter data
-        voters = self.parse_voter_data(text, header_info)
+        # Records depend on the PDF reader, so it is part of the cache signature
+        backend = _pdf_backend_id() if self.use_cache else None
+        if backend is not None:
+            cached = ResultCache.load(pdf_path, backend)
+            if cached is not None:
+                logger.info("Loaded %d cached voter records for %s", len(cached), os.path.basename(pdf_path))
+                yield from cached
+                return
         
-        logger.info(f"Extracted {len(voters)} voter records from {os.path.basename(pdf_path)}")
-        return voters
+        # Only one page's text, tables and records are held at a time;
+        # the file's records are also kept when they are to be cached
+        count = 0
+        voters = [] if self.use_cache else None
+        try:
+            if workers > 1:
+                batches = self._iter_page_voters_parallel(pdf_path, workers)
+            else:
+                batches = self._iter_page_voters(pdf_path)
+            
+            for page_voters in batches:
+                count += len(page_voters)
+                if voters is not None:
+                    voters.extend(page_voters)
+                yield from page_voters
+        except Exception as e:
+            logger.error(f"Error extracting text from {pdf_path}: {str(e)}")
+            return
+        
+        if not count:
+            logger.warning("No voter records extracted from %s", pdf_path)
+            return
+        
+        if voters is not None:
+            ResultCache.store(pdf_path, voters, backend)
+        
+        logger.info("Extracted %d voter records from %s", count, os.path.basename(pdf_path))
     
-    def process_directory(self, input_path: str) -> List[Dict[str, str]]:
-        """Process all PDF files in a directory or single file"""
-        pdf_files = []
+    def _iter_page_voters(self, pdf_path: str, header_info: Optional[Dict[str, str]] = None,
+                          start: int = 0, stop: Optional[int] = None) -> Iterator[List[Dict[str, str]]]:
+        """Yield the voter records of each page from start to stop, reading the header from the first if not given"""
+        with _open_pdf_pages(pdf_path, start=start, stop=stop) as pages:
+            for page in pages:
+                page_text = None
+                if header_info is None:
+                    header_info, page_text = self._read_header(page)
+                
+                # Parse voter data from the page tables, falling back to its text.
+                # Records are validated a page at a time, which is why
+                # _validate_columns keeps small batches free of NumPy setup
+                tables_data = [row for table in page.extract_tables() or () for row in table]
+                page_voters = list(self._iter_from_tables(tables_data, header_info))
+                if not page_voters:
+                    if page_text is None:
+                        page_text = page.extract_text()
+                    if page_text:
+                        page_voters = list(self._iter_from_text(page_text, header_info))
+                
+                yield page_voters
+    
+    def _iter_page_voters_parallel(self, pdf_path: str, workers: int) -> Iterator[List[Dict[str, str]]]:
+        """Yield the voter records of consecutive page ranges parsed by worker processes"""
+        # PyMuPDF documents cannot be shared between threads, so each
+        # process opens the file itself and parses its own range of pages
+        page_count = _pdf_page_count(pdf_path)
+        workers = min(workers, page_count // _MIN_PAGES_PER_WORKER)
+        if workers <= 1:
+            yield from self._iter_page_voters(pdf_path)
+            return
         
-        if os.path.isfile(input_path):
-            if input_path.lower().endswith('.pdf'):
-                pdf_files = [input_path]
-        else:
-            for root, dirs, files in os.walk(input_path):
-                for file in files:
-                    if file.lower().endswith('.pdf'):
-                        pdf_files.append(os.path.join(root, file))
+        with _open_pdf_pages(pdf_path, stop=1) as pages:
+            header_info = next((self._read_header(page)[0] for page in pages), None)
+        
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_process_pages, pdf_path, header_info, start, stop)
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+            for future in futures:
+                yield future.result()
+    
+    def _read_header(self, page) -> Tuple[Dict[str, str], Optional[str]]:
+        """Parse header information from a roll's first page; also return the page text if it was read"""
+        # Only the top band of the page is read unless some header field is not there
+        page_text = None
+        found = self._search_header(_header_band_text(page) or '')
+        if len(found) < len(_HEADER_PATTERNS):
+            page_text = page.extract_text()
+            found = self._search_header(page_text or '')
+        
+        header_info = self._build_header_info(found)
+        logger.debug("Header info: %s", header_info)
+        return header_info, page_text
+    
+    def process_single_pdf(self, pdf_path: str) -> List[Dict[str, str]]:
+        """Process a single PDF file"""
+        return list(self.iter_pdf_voters(pdf_path))
+    
+    def process_single_pdf_columns(self, pdf_path: str) -> Dict[str, List[str]]:
+        """Process a single PDF file into field -> values columns, '' where a record lacks the field"""
+        # Columns pickle without repeating every key per record and build a
+        # DataFrame without a per-row pass
+        voters = self.process_single_pdf(pdf_path)
+        fields = dict.fromkeys(key for voter in voters for key in voter)
+        return {field: [voter.get(field, '') for voter in voters] for field in fields}
+    
+    def iter_voters(self, input_path: str, workers: Optional[int] = None) -> Iterator[Dict[str, str]]:
+        """Yield voter records from a PDF file or directory, one file at a time"""
+        # Files are parsed by up to `workers` processes (all CPUs by default)
+        # but records are still yielded in file order
+        workers = workers or os.cpu_count() or 1
+        
+        if workers == 1:
+            # Reuses the scan made while validating the input path
+            pdf_files = FileHandler.get_pdf_files(input_path)
+            logger.info(f"Found {len(pdf_files)} PDF files to process")
+            
+            for pdf_file in pdf_files:
+                yield from self.iter_pdf_voters(pdf_file)
+            return
         
-        logger.info(f"Found {len(pdf_files)} PDF files to process")
+        # Largest first, so one big roll submitted last does not finish last
+        sized_files = FileHandler.get_pdf_files_with_sizes(input_path, largest_first=True)
+        logger.info(f"Found {len(sized_files)} PDF files to process")
         
-        all_voters = []
-        for pdf_file in pdf_files:
-            voters = self.process_single_pdf(pdf_file)
-            all_voters.extend(voters)
+        if len(sized_files) <= 1:
+            # A single roll is split across the workers by page ranges instead
+            for pdf_file, _ in sized_files:
+                yield from self.iter_pdf_voters(pdf_file, workers)
+            return
+        
+        pool_size = min(workers, len(sized_files))
+        max_pending = pool_size * _PENDING_PER_WORKER
+        with ProcessPoolExecutor(max_workers=pool_size) as executor:
+            futures = {}
+            submitted = set()
+            largest = (pdf_file for pdf_file, _ in sized_files)
+            
+            def submit(pdf_file):
+                submitted.add(pdf_file)
+                futures[pdf_file] = executor.submit(_process_one, pdf_file, self.use_cache)
+            
+            # Same path order as get_pdf_files. The next file in that order is
+            # always submitted; spare slots go to the largest files not yet
+            # started, so at most max_pending files' records are held here
+            for pdf_file in sorted(pdf_file for pdf_file, _ in sized_files):
+                if pdf_file not in submitted:
+                    submit(pdf_file)
+                while len(futures) < max_pending:
+                    candidate = next(largest, None)
+                    if candidate is None:
+                        break
+                    if candidate not in submitted:
+                        submit(candidate)
+                
+                yield from futures.pop(pdf_file).result()
+    
+    def process_directory(self, input_path: str, workers: Optional[int] = None) -> List[Dict[str, str]]:
+        """Process all PDF files in a directory or single file"""
+        all_voters = list(self.iter_voters(input_path, workers))
         
         self.extracted_data = all_voters
         logger.info(f"Total records extracted: {len(all_voters)}")
-        return all_voters
\ No newline at end of file
+        return all_voters
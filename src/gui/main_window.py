@@ -5,6 +5,7 @@ Main GUI window for the electoral roll extractor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+import queue
 import os
 from typing import Optional, List
 
@@ -30,11 +31,20 @@ class MainWindow:
         self.input_path = tk.StringVar()
         self.output_path = tk.StringVar()
         self.processing = False
+        self._log_queue = queue.Queue()
+        
+        # A single long-lived worker runs extraction jobs so repeated runs
+        # reuse the warm extractor instead of starting a thread per click
+        self._job_queue = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
         
         # Setup GUI
         self.setup_styles()
         self.create_widgets()
         self.center_window()
+        self.root.after(50, self._drain_log)
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
     
     def setup_styles(self):
         """Setup custom styles for the GUI"""
@@ -113,7 +123,7 @@ class MainWindow:
             side=tk.LEFT, padx=5
         )
         
-        ttk.Button(button_frame, text="Exit", command=self.root.quit).pack(
+        ttk.Button(button_frame, text="Exit", command=self.quit).pack(
             side=tk.LEFT, padx=5
         )
         
@@ -190,22 +200,36 @@ class MainWindow:
         """Clear all input fields and log"""
         self.input_path.set("")
         self.output_path.set("")
+        FileHandler.invalidate()
         self.log_text.delete(1.0, tk.END)
         self.status_label.config(text="Ready")
     
     def log_message(self, message: str):
-        """Add message to log text widget"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue message for the log text widget (safe to call from the worker thread)"""
+        self._log_queue.put(message)
+    
+    def _drain_log(self):
+        """Append queued log messages in one batch, then reschedule on the Tk main loop"""
+        batch = []
+        try:
+            while len(batch) < 100:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch:
+            self.log_text.insert(tk.END, '\n'.join(batch) + '\n')
+            self.log_text.see(tk.END)
+        
+        self.root.after(50, self._drain_log)
     
     def update_status(self, status: str):
-        """Update status label"""
-        self.status_label.config(text=status)
-        self.root.update_idletasks()
+        """Update status label (safe to call from the worker thread)"""
+        # Tk widgets may only be touched from the main loop's thread
+        self.root.after(0, lambda: self.status_label.config(text=status))
     
     def start_extraction(self):
-        """Start the extraction process in a separate thread"""
+        """Queue the extraction job for the worker thread"""
         if self.processing:
             messagebox.showwarning("Warning", "Extraction is already in progress")
             return
@@ -218,7 +242,8 @@ class MainWindow:
             return
         
         # Validate paths
-        if not FileHandler.validate_input_path(input_path.split(';')[0]):
+        inputs = FileHandler.normalize_inputs(input_path)
+        if not inputs or not all(FileHandler.validate_input_path(path) for path in inputs):
             messagebox.showerror("Error", "Invalid input path or no PDF files found")
             return
         
@@ -226,43 +251,54 @@ class MainWindow:
             messagebox.showerror("Error", "Invalid output path or insufficient permissions")
             return
         
-        # Start extraction in separate thread
+        # Hand the job to the worker thread
         self.processing = True
         self.extract_button.config(state='disabled')
         self.progress.start()
         
-        thread = threading.Thread(target=self.extract_data, daemon=True)
-        thread.start()
+        self._job_queue.put((input_path, output_path))
+    
+    def _worker_loop(self):
+        """Run queued extraction jobs until the None sentinel arrives"""
+        while True:
+            job = self._job_queue.get()
+            if job is None:
+                return
+            self.extract_data(*job)
     
-    def extract_data(self):
-        """Extract data from PDFs (runs in separate thread)"""
+    def extract_data(self, input_path: str, output_path: str):
+        """Extract data from PDFs (runs on the worker thread)"""
         try:
-            input_path = self.input_path.get().strip()
-            output_path = self.output_path.get().strip()
-            
             self.update_status("Starting extraction...")
             self.log_message("=" * 50)
             self.log_message("Starting Electoral Roll Data Extraction")
             self.log_message("=" * 50)
             
-            # Process files
-            if ';' in input_path:  # Multiple files
-                files = [f.strip() for f in input_path.split(';')]
-                all_voters = []
+            # Process files; every input is expanded like the CLI does, so a
+            # folder listed next to files contributes its PDFs too. Each folder
+            # is sorted so the workbook rows follow the file names, and cached
+            # since start_extraction has just scanned it
+            self.update_status("Processing files...")
+            files = [
+                file_path
+                for path in FileHandler.normalize_inputs(input_path)
+                for file_path in FileHandler.get_pdf_files(path)
+            ]
+            
+            all_voters = []
+            for i, file_path in enumerate(files, 1):
+                name = os.path.basename(file_path)
+                self.update_status(f"Processing file {i}/{len(files)}")
+                self.log_message(f"Processing: {name}")
                 
-                for i, file_path in enumerate(files, 1):
-                    self.update_status(f"Processing file {i}/{len(files)}")
-                    self.log_message(f"Processing: {os.path.basename(file_path)}")
-                    
-                    voters = self.extractor.process_single_pdf(file_path)
-                    all_voters.extend(voters)
-                    
-                    self.log_message(f"Extracted {len(voters)} records from {os.path.basename(file_path)}")
+                # Records are appended as each page yields them, with no
+                # per-file list in between
+                start = len(all_voters)
+                all_voters.extend(self.extractor.iter_pdf_voters(file_path))
                 
-                self.extractor.extracted_data = all_voters
-            else:
-                self.update_status("Processing files...")
-                self.extractor.process_directory(input_path)
+                self.log_message(f"Extracted {len(all_voters) - start} records from {name}")
+            
+            self.extractor.extracted_data = all_voters
             
             # Save to Excel
             self.update_status("Saving to Excel...")
@@ -294,10 +330,19 @@ class MainWindow:
             self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
         
         finally:
-            # Reset UI state
-            self.processing = False
-            self.progress.stop()
-            self.extract_button.config(state='normal')
+            # Reset UI state on the Tk main loop
+            self.root.after(0, self._reset_ui)
+    
+    def _reset_ui(self):
+        """Stop the progress bar and re-enable extraction once a job is done"""
+        self.processing = False
+        self.progress.stop()
+        self.extract_button.config(state='normal')
+    
+    def quit(self):
+        """Stop the worker thread and leave the Tk main loop"""
+        self._job_queue.put(None)
+        self.root.quit()
     
     def run(self):
         """Run the GUI application"""
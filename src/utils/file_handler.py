@@ -2,45 +2,271 @@
 File handling utilities for the electoral roll extractor
 """
 
+import itertools
 import os
 import re
-import pandas as pd
-from typing import List, Dict, Optional
+import stat
+from typing import TYPE_CHECKING, Any, Callable, List, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
 import logging
 
+# pandas, openpyxl and xlsxwriter are imported where the workbook is built, so importing
+# this module (and starting the CLI or GUI) does not pay for them
+if TYPE_CHECKING:
+    import pandas as pd
+    from openpyxl import Workbook
+
 logger = logging.getLogger(__name__)
 
+# Excel column order matching the screenshot
+COLUMN_ORDER = [
+    'st_code',           # ST_CODE
+    'ac_no',             # AC_NO
+    'part_no',           # PART_NO
+    'serial_number',     # SLNOINPART
+    'house_number',      # C_HOUSE_NO
+    'first_name',        # FM_NAME_EN
+    'last_name',         # LASTNAME_EN
+    'first_name_vernacular',      # FM_NAME_V1
+    'last_name_vernacular',       # LASTNAME_V1
+    'relation_type',     # RLN_TYPE
+    'relation_name_en',  # RLN_FM_NM_EN
+    'relation_last_name_en',      # RLN_L_NM_EN
+    'relation_name_vernacular',   # RLN_FM_NM_V1
+    'relation_last_name_vernacular', # RLN_L_NM_V1
+    'epic_number',       # EPIC_NO
+    'gender',            # GENDER
+    'age'                # AGE
+]
+
+# Excel column headers matching the screenshot
+COLUMN_HEADERS = {
+    'st_code': 'ST_CODE',
+    'ac_no': 'AC_NO',
+    'part_no': 'PART_NO',
+    'serial_number': 'SLNOINPART',
+    'house_number': 'C_HOUSE_NO',
+    'first_name': 'FM_NAME_EN',
+    'last_name': 'LASTNAME_EN',
+    'first_name_vernacular': 'FM_NAME_V1',
+    'last_name_vernacular': 'LASTNAME_V1',
+    'relation_type': 'RLN_TYPE',
+    'relation_name_en': 'RLN_FM_NM_EN',
+    'relation_last_name_en': 'RLN_L_NM_EN',
+    'relation_name_vernacular': 'RLN_FM_NM_V1',
+    'relation_last_name_vernacular': 'RLN_L_NM_V1',
+    'epic_number': 'EPIC_NO',
+    'gender': 'GENDER',
+    'age': 'AGE'
+}
+
+# Output filename cleanup patterns
+_FILENAME_SANITIZE = re.compile(r'[^\w\s.-]')
+_FILENAME_WS = re.compile(r'\s+')
+_FILENAME_UNDERSCORES = re.compile(r'_+')
+
+
+def _column_widths(df: 'pd.DataFrame', max_width: int = 50) -> List[int]:
+    """Compute Excel column widths from the longest header or value in each column"""
+    value_lengths = df.astype(str).apply(lambda column: column.str.len().max())
+    return [
+        min(max(len(str(header)), int(length)) + 2, max_width)
+        for header, length in zip(df.columns, value_lengths)
+    ]
+
+
+def _build_frame(data: List[Dict[str, str]]) -> 'pd.DataFrame':
+    """Build the output frame column by column with the final header names"""
+    import pandas as pd
+    
+    return pd.DataFrame(
+        {COLUMN_HEADERS[col]: [record.get(col, '') for record in data] for col in COLUMN_ORDER},
+        copy=False
+    )
+
+
+def _create_sheet(df: 'pd.DataFrame') -> Tuple['Workbook', Any]:
+    """Create a write-only workbook with sized columns and a bold header row"""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+    
+    # Stream rows through a write-only workbook so no Cell objects are kept
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Electoral_Data')
+    
+    # Column widths must be set before any rows are written
+    for i, width in enumerate(_column_widths(df), 1):
+        worksheet.column_dimensions[get_column_letter(i)].width = width
+    
+    header_font = Font(bold=True)
+    header_cells = []
+    for header in df.columns:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.font = header_font
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+    
+    return workbook, worksheet
+
+
+def _open_streaming_sheet(df: 'pd.DataFrame', full_path: str) -> Tuple[Callable[[List[Any]], None], Callable[[], None]]:
+    """Open a sheet for row-by-row writing; return (append_row, finish)"""
+    try:
+        import xlsxwriter
+    except ImportError:
+        workbook, worksheet = _create_sheet(df)
+        return worksheet.append, lambda: workbook.save(full_path)
+    
+    # constant_memory flushes each row to disk once the next one starts,
+    # so only a single row is buffered however many records are written
+    workbook = xlsxwriter.Workbook(full_path, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Electoral_Data')
+    
+    for i, width in enumerate(_column_widths(df)):
+        worksheet.set_column(i, i, width)
+    worksheet.write_row(0, 0, list(df.columns), workbook.add_format({'bold': True}))
+    
+    rows = itertools.count(1)
+    
+    def append_row(row: List[Any]) -> None:
+        worksheet.write_row(next(rows), 0, row)
+    
+    return append_row, workbook.close
+
+
+def _walk_pdf_entries(root: str, dir_mtimes: Optional[Dict[str, int]] = None) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for PDFs under root, optionally recording the mtime of every subdirectory visited"""
+    stack = [root]
+    
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # DirEntry type checks are served from the readdir buffer
+                    if entry.is_dir(follow_symlinks=False):
+                        if dir_mtimes is not None:
+                            dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+                        stack.append(entry.path)
+                    elif entry.name[-4:].lower() == '.pdf':
+                        # Lower-case only the suffix rather than the whole name
+                        yield entry
+        except OSError:
+            continue
+
+
+def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    """Check that none of the scanned directories were modified since the scan"""
+    try:
+        return all(os.stat(d).st_mtime_ns == mtime for d, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def _scan_is_fresh(entry: Tuple[Tuple[int, int, int], Dict[str, int], List[str]], st: os.stat_result) -> bool:
+    """Check a cached scan against the current stat of its root directory"""
+    # Device and inode catch a different filesystem mounted at the same path.
+    # Adding or removing a file bumps its parent directory's mtime, so
+    # re-checking directory mtimes is enough to detect a stale listing.
+    root, dir_mtimes, _ = entry
+    return root == (st.st_dev, st.st_ino, st.st_mtime_ns) and _dirs_unchanged(dir_mtimes)
+
 
 class FileHandler:
     """Handles file operations for the electoral roll extractor"""
     
+    # Resolved input path -> (root identity, subdirectory mtimes, sorted PDF files).
+    # Empty listings are kept too, so re-validating a folder without PDFs
+    # costs a single stat while nothing under it changes.
+    _scan_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, int], List[str]]] = {}
+    
+    # Output directories known to exist, either stat'ed by validate_output_path
+    # or created by an earlier save
+    _created_dirs: Set[str] = set()
+    
+    @classmethod
+    def _cached_scan(cls, path: str) -> Optional[List[str]]:
+        """Get the shared PDF list for path, or None if it is not an existing directory"""
+        key = os.path.realpath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        
+        if not stat.S_ISDIR(st.st_mode):
+            return None
+        
+        cached = cls._scan_cache.get(key)
+        if cached and _scan_is_fresh(cached, st):
+            return cached[2]
+        
+        dir_mtimes = {}
+        pdf_files = sorted(entry.path for entry in _walk_pdf_entries(path, dir_mtimes))
+        cls._scan_cache[key] = ((st.st_dev, st.st_ino, st.st_mtime_ns), dir_mtimes, pdf_files)
+        return pdf_files
+    
+    @classmethod
+    def scan(cls, path: str) -> List[str]:
+        """Get sorted PDF files for a path, reusing the previous scan while the tree is unchanged"""
+        pdf_files = cls._cached_scan(path)
+        if pdf_files is not None:
+            return list(pdf_files)
+        
+        if os.path.isfile(path) and path.lower().endswith('.pdf'):
+            return [path]
+        return []
+    
+    @classmethod
+    def invalidate(cls):
+        """Drop cached directory scans and output directory checks"""
+        cls._scan_cache.clear()
+        cls._created_dirs.clear()
+    
     @staticmethod
-    def validate_input_path(path: str) -> bool:
-        """Validate if input path exists and contains PDF files"""
-        if not os.path.exists(path):
-            return False
+    def normalize_inputs(paths: Union[str, Iterable[Optional[str]]]) -> List[str]:
+        """Normalize input paths given as a list or a semicolon-separated string"""
+        if isinstance(paths, str):
+            paths = paths.split(';')
         
-        if os.path.isfile(path):
-            return path.lower().endswith('.pdf')
+        inputs = []
+        for path in paths:
+            path = path.strip() if path else ''
+            if path and path not in inputs:
+                inputs.append(path)
         
-        # Check if directory contains PDF files
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if file.lower().endswith('.pdf'):
-                    return True
+        return inputs
+    
+    @staticmethod
+    def validate_input_path(path: str) -> bool:
+        """Validate if input path exists and contains PDF files"""
+        pdf_files = FileHandler._cached_scan(path)
+        if pdf_files is not None:
+            return bool(pdf_files)
         
-        return False
+        return os.path.isfile(path) and path.lower().endswith('.pdf')
     
     @staticmethod
     def validate_output_path(path: str) -> bool:
         """Validate if output path is writable"""
-        if os.path.isfile(path):
-            # Check if file is writable
-            return os.access(path, os.W_OK)
+        try:
+            st = os.stat(path)
+        except OSError:
+            # New file or folder: the parent directory must exist and be writable.
+            # A folder removed since an earlier save must be created again
+            FileHandler._created_dirs.discard(os.path.abspath(path))
+            parent = os.path.dirname(path) or '.'
+            try:
+                st = os.stat(parent)
+            except OSError:
+                return False
+            if not stat.S_ISDIR(st.st_mode):
+                return False
+            FileHandler._created_dirs.add(os.path.abspath(parent))
+            return os.access(parent, os.W_OK)
         
-        # Check if directory exists and is writable
-        directory = os.path.dirname(path) if os.path.dirname(path) else path
-        return os.path.exists(directory) and os.access(directory, os.W_OK)
+        if stat.S_ISDIR(st.st_mode):
+            FileHandler._created_dirs.add(os.path.abspath(path))
+        return os.access(path, os.W_OK)
     
     @staticmethod
     def generate_output_filename(data: List[Dict[str, str]]) -> str:
@@ -60,9 +286,9 @@ class FileHandler:
         filename = f"{part_no}_{booth_name}_{ac_no}_{st_code}.xlsx"
         
         # Clean filename - remove special characters and normalize spaces
-        filename = re.sub(r'[^\w\s.-]', '', filename)  # Keep dots for extension
-        filename = re.sub(r'[\s]+', '_', filename)
-        filename = filename.replace('__', '_').strip('_')
+        filename = _FILENAME_SANITIZE.sub('', filename)  # Keep dots for extension
+        filename = _FILENAME_WS.sub('_', filename)
+        filename = _FILENAME_UNDERSCORES.sub('_', filename).strip('_')
         
         # Ensure it ends with .xlsx
         if not filename.endswith('.xlsx'):
@@ -70,6 +296,28 @@ class FileHandler:
         
         return filename
     
+    @staticmethod
+    def _prepare_output_file(data: List[Dict[str, str]], output_path: str) -> str:
+        """Resolve the Excel file path for the data and make sure its folder exists"""
+        # Generate filename
+        filename = FileHandler.generate_output_filename(data)
+        
+        # Determine full output path
+        if output_path.endswith('.xlsx'):
+            full_path = output_path
+        else:
+            full_path = os.path.join(output_path, filename)
+        
+        # Ensure directory exists, unless validation or an earlier save saw it
+        directory = os.path.dirname(full_path)
+        if directory:
+            directory = os.path.abspath(directory)
+            if directory not in FileHandler._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                FileHandler._created_dirs.add(directory)
+        
+        return full_path
+    
     @staticmethod
     def save_to_excel(data: List[Dict[str, str]], output_path: str) -> Optional[str]:
         """Save extracted data to Excel file matching the Google Sheets format"""
@@ -78,118 +326,85 @@ class FileHandler:
             return None
         
         try:
-            # Create DataFrame
-            df = pd.DataFrame(data)
-            
-            # Define column order matching the screenshot
-            column_order = [
-                'st_code',           # ST_CODE
-                'ac_no',             # AC_NO
-                'part_no',           # PART_NO
-                'serial_number',     # SLNOINPART
-                'house_number',      # C_HOUSE_NO
-                'first_name',        # FM_NAME_EN
-                'last_name',         # LASTNAME_EN
-                'first_name_vernacular',      # FM_NAME_V1
-                'last_name_vernacular',       # LASTNAME_V1
-                'relation_type',     # RLN_TYPE
-                'relation_name_en',  # RLN_FM_NM_EN
-                'relation_last_name_en',      # RLN_L_NM_EN
-                'relation_name_vernacular',   # RLN_FM_NM_V1
-                'relation_last_name_vernacular', # RLN_L_NM_V1
-                'epic_number',       # EPIC_NO
-                'gender',            # GENDER
-                'age'                # AGE
-            ]
+            df = _build_frame(data)
+            full_path = FileHandler._prepare_output_file(data, output_path)
             
-            # Define column headers matching the screenshot
-            column_headers = {
-                'st_code': 'ST_CODE',
-                'ac_no': 'AC_NO',
-                'part_no': 'PART_NO',
-                'serial_number': 'SLNOINPART',
-                'house_number': 'C_HOUSE_NO',
-                'first_name': 'FM_NAME_EN',
-                'last_name': 'LASTNAME_EN',
-                'first_name_vernacular': 'FM_NAME_V1',
-                'last_name_vernacular': 'LASTNAME_V1',
-                'relation_type': 'RLN_TYPE',
-                'relation_name_en': 'RLN_FM_NM_EN',
-                'relation_last_name_en': 'RLN_L_NM_EN',
-                'relation_name_vernacular': 'RLN_FM_NM_V1',
-                'relation_last_name_vernacular': 'RLN_L_NM_V1',
-                'epic_number': 'EPIC_NO',
-                'gender': 'GENDER',
-                'age': 'AGE'
-            }
+            workbook, worksheet = _create_sheet(df)
+            for row in df.itertuples(index=False, name=None):
+                worksheet.append(row)
             
-            # Ensure all columns exist, fill missing with empty strings
-            for col in column_order:
-                if col not in df.columns:
-                    df[col] = ''
+            workbook.save(full_path)
             
-            # Reorder columns
-            df = df.reindex(columns=column_order)
-            
-            # Rename columns to match header format
-            df = df.rename(columns=column_headers)
-            
-            # Generate filename
-            filename = FileHandler.generate_output_filename(data)
-            
-            # Determine full output path
-            if output_path.endswith('.xlsx'):
-                full_path = output_path
-            else:
-                full_path = os.path.join(output_path, filename)
-            
-            # Ensure directory exists
-            directory = os.path.dirname(full_path)
-            if directory:
-                os.makedirs(directory, exist_ok=True)
+            logger.info(f"Data saved successfully to: {full_path}")
+            return full_path
             
-            # Save to Excel with formatting
-            with pd.ExcelWriter(full_path, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Electoral_Data')
+        except Exception as e:
+            logger.error(f"Error saving to Excel: {str(e)}")
+            return None
+    
+    @staticmethod
+    def save_to_excel_streaming(batches: Iterable[List[Dict[str, str]]], output_path: str) -> Optional[str]:
+        """Save batches of records to Excel as they arrive, without holding all rows in memory"""
+        # The workbook is written under a temporary name and only renamed
+        # over the output once complete, so a failed run never leaves a
+        # truncated file behind or replaces an earlier good one
+        partial_path = None
+        try:
+            append_row = None
+            for batch in batches:
+                if not batch:
+                    continue
                 
-                # Get workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Electoral_Data']
+                if append_row is None:
+                    # Filename and column widths come from the first batch
+                    full_path = FileHandler._prepare_output_file(batch, output_path)
+                    partial_path = full_path + '.partial'
+                    append_row, finish = _open_streaming_sheet(_build_frame(batch), partial_path)
                 
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+                for record in batch:
+                    append_row([record.get(col, '') for col in COLUMN_ORDER])
+            
+            if append_row is None:
+                logger.warning("No data to save")
+                return None
+            
+            finish()
+            os.replace(partial_path, full_path)
             
             logger.info(f"Data saved successfully to: {full_path}")
             return full_path
             
         except Exception as e:
             logger.error(f"Error saving to Excel: {str(e)}")
+            if partial_path is not None:
+                # Closing the abandoned workbook releases its temporary files
+                try:
+                    finish()
+                except Exception:
+                    pass
+                try:
+                    os.unlink(partial_path)
+                except OSError:
+                    pass
             return None
     
     @staticmethod
     def get_pdf_files(input_path: str) -> List[str]:
-        """Get list of PDF files from input path"""
+        """Get sorted list of PDF files from input path"""
+        return FileHandler.scan(input_path)
+    
+    @staticmethod
+    def get_pdf_files_with_sizes(input_path: str, largest_first: bool = False) -> List[Tuple[str, int]]:
+        """Get (path, size in bytes) for each PDF file, sorted by path or largest first"""
+        # The listing is the shared cached scan; only the sizes are stat'ed,
+        # as rewriting a file in place leaves its directory's mtime unchanged
         pdf_files = []
+        for pdf_file in FileHandler.scan(input_path):
+            try:
+                pdf_files.append((pdf_file, os.path.getsize(pdf_file)))
+            except OSError:
+                continue
         
-        if os.path.isfile(input_path):
-            if input_path.lower().endswith('.pdf'):
-                pdf_files = [input_path]
-        else:
-            for root, dirs, files in os.walk(input_path):
-                for file in files:
-                    if file.lower().endswith('.pdf'):
-                        pdf_files.append(os.path.join(root, file))
-        
-        return sorted(pdf_files)
\ No newline at end of file
+        if largest_first:
+            pdf_files.sort(key=lambda item: (-item[1], item[0]))
+        return pdf_files
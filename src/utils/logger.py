@@ -3,10 +3,29 @@ Logging configuration for the electoral roll extractor
 """
 
 import logging
+import os
 import sys
 from typing import Optional
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records within the same second"""
+    
+    _cached_time = (None, '')
+    
+    def formatTime(self, record, datefmt=None):
+        if not datefmt:
+            # The default format includes milliseconds
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._cached_time = (second, formatted)
+        return formatted
+
+
 class Logger:
     """Centralized logging configuration"""
     
@@ -19,24 +38,32 @@ class Logger:
         logger = logging.getLogger(name)
         logger.setLevel(level)
         
-        # Prevent duplicate handlers
-        if logger.handlers:
-            return logger
+        # Reuse existing handlers, only updating their level
+        console_handler = None
+        file_paths = set()
+        for handler in logger.handlers:
+            handler.setLevel(level)
+            if isinstance(handler, logging.FileHandler):
+                file_paths.add(handler.baseFilename)
+            elif isinstance(handler, logging.StreamHandler):
+                console_handler = handler
         
         # Create formatter
-        formatter = logging.Formatter(
+        # The date format has no sub-second part, so one strftime per second is enough
+        formatter = _CachedTimeFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
         # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        if console_handler is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(level)
+            console_handler.setFormatter(formatter)
+            logger.addHandler(console_handler)
         
         # File handler (optional)
-        if log_file:
+        if log_file and os.path.abspath(log_file) not in file_paths:
             try:
                 file_handler = logging.FileHandler(log_file)
                 file_handler.setLevel(level)
@@ -0,0 +1,85 @@
+"""
+On-disk cache of extracted voter records for the electoral roll extractor
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever parsing changes so records cached by older versions are ignored
+# (4: signatures name the PDF reader; header read from the top band of page one;
+# 5: rows of tables with a header row need every column and a numeric serial)
+CACHE_VERSION = 5
+
+
+class ResultCache:
+    """Caches the records extracted from each PDF, keyed by its path, mtime, size and the PDF reader used"""
+    
+    @staticmethod
+    def get_cache_directory() -> str:
+        """Get the cache directory, honouring ELECTORAL_EXTRACTOR_CACHE and XDG_CACHE_HOME"""
+        directory = os.environ.get('ELECTORAL_EXTRACTOR_CACHE')
+        if directory:
+            return directory
+        
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(base, 'electoral_extractor')
+    
+    @staticmethod
+    def _entry(pdf_path: str, backend: str = '') -> Optional[Tuple[str, List]]:
+        """Return (cache file, file signature), or None if the PDF cannot be stat'ed"""
+        try:
+            st = os.stat(pdf_path)
+        except OSError:
+            return None
+        
+        path = os.path.abspath(pdf_path)
+        name = hashlib.sha1(path.encode('utf-8', 'surrogatepass')).hexdigest() + '.json'
+        signature = [CACHE_VERSION, path, st.st_mtime_ns, st.st_size, backend]
+        return os.path.join(ResultCache.get_cache_directory(), name), signature
+    
+    @staticmethod
+    def load(pdf_path: str, backend: str = '') -> Optional[List[Dict[str, str]]]:
+        """Return the cached records for a PDF if it is unchanged and was read with the same backend"""
+        entry = ResultCache._entry(pdf_path, backend)
+        if entry is None:
+            return None
+        
+        cache_file, signature = entry
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('signature') != signature:
+            return None
+        return cached.get('voters')
+    
+    @staticmethod
+    def store(pdf_path: str, voters: List[Dict[str, str]], backend: str = '') -> None:
+        """Store the records extracted from a PDF with the given backend"""
+        entry = ResultCache._entry(pdf_path, backend)
+        if entry is None:
+            return
+        
+        cache_file, signature = entry
+        directory = os.path.dirname(cache_file)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'signature': signature, 'voters': voters}, f, ensure_ascii=False)
+                os.replace(temp_path, cache_file)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.debug("Could not cache records for %s: %s", pdf_path, e)
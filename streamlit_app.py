@@ -10,19 +10,16 @@ Author: Data Scrapper Intern Applicant
 """
 
 import streamlit as st
-import sys
 import os
+import shutil
 import tempfile
 import io
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 try:
-    from src.core.extractor import ElectoralRollExtractor
-    from src.utils.file_handler import FileHandler
-    from src.utils.logger import Logger
+    from src.core.extractor import process_pdf_columns
 except ImportError as e:
     st.error(f"Error importing modules: {e}")
     st.stop()
@@ -35,6 +32,23 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_executor():
+    """Get the worker process pool shared by every rerun and session"""
+    # Workers keep their extractor, imported PDF libraries and compiled
+    # patterns between clicks instead of starting from scratch
+    return ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 4))
+
+def submit_to_pool(fn, *args):
+    """Submit a task to the shared pool, replacing the pool if a worker crash broke it"""
+    # A pool whose worker died (e.g. killed for running out of memory)
+    # refuses new work for good, and cache_resource would keep handing it out
+    try:
+        return get_executor().submit(fn, *args)
+    except BrokenProcessPool:
+        get_executor.clear()
+        return get_executor().submit(fn, *args)
+
 def main():
     """Main Streamlit application"""
     
@@ -95,56 +109,73 @@ def extract_data(uploaded_files):
     progress_bar = st.progress(0)
     status_text = st.empty()
     
+    # Temporary file path -> uploaded file name, in upload order
+    tmp_files = {}
+    
     try:
-        # Initialize extractor
-        status_text.text("Initializing extractor...")
-        extractor = ElectoralRollExtractor()
+        # PDFs are parsed in parallel worker processes. The worker function
+        # lives in the extractor module because Streamlit runs this script as
+        # __main__, which worker processes cannot import functions from.
+        # Temporary uploads are never seen again, so they skip the result cache.
+        futures = {}
+        
+        # Each upload is handed to a worker as soon as it is saved, so the
+        # remaining uploads are written while the first ones are parsed
+        status_text.text("Saving uploaded files...")
+        for uploaded_file in uploaded_files:
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
+                tmp_files[tmp_file.name] = uploaded_file.name
+                # Copy in 1 MiB chunks rather than making a bytes copy of the whole file
+                uploaded_file.seek(0)
+                shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
+            futures[submit_to_pool(process_pdf_columns, tmp_file.name, False)] = tmp_file.name
         
-        all_voters = []
-        total_files = len(uploaded_files)
+        results = {}
+        total_files = len(tmp_files)
+        status_text.text(f"Processing {total_files} file(s)...")
         
-        for i, uploaded_file in enumerate(uploaded_files):
-            # Update progress
-            progress = (i + 1) / total_files
-            progress_bar.progress(progress)
-            status_text.text(f"Processing {uploaded_file.name}... ({i+1}/{total_files})")
+        for done, future in enumerate(as_completed(futures), 1):
+            tmp_file_path = futures[future]
+            name = tmp_files[tmp_file_path]
             
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_file_path = tmp_file.name
+            # Update progress
+            progress_bar.progress(done / total_files)
+            status_text.text(f"Processed {name} ({done}/{total_files})")
             
             try:
-                # Extract data from the PDF
-                voters = extractor.process_pdf(tmp_file_path)
-                if voters:
-                    all_voters.extend(voters)
-                    st.success(f"✅ Extracted {len(voters)} records from {uploaded_file.name}")
+                # Each worker returns its records as field -> values columns
+                columns = future.result()
+                if columns:
+                    results[tmp_file_path] = columns
+                    st.success(f"✅ Extracted {count_records(columns)} records from {name}")
                 else:
-                    st.warning(f"⚠️ No data extracted from {uploaded_file.name}")
+                    st.warning(f"⚠️ No data extracted from {name}")
             
-            except Exception as e:
-                st.error(f"❌ Error processing {uploaded_file.name}: {str(e)}")
+            except BrokenProcessPool:
+                # Drop the dead pool so the next extraction starts a new one
+                get_executor.clear()
+                st.error(f"❌ Error processing {name}: a worker process stopped unexpectedly, please try again")
             
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(tmp_file_path)
-                except:
-                    pass
+            except Exception as e:
+                st.error(f"❌ Error processing {name}: {str(e)}")
+        
+        # Keep records in upload order regardless of which file finished first
+        all_voters = concat_columns([results[path] for path in tmp_files if path in results])
         
         # Final results
         progress_bar.progress(1.0)
         status_text.text("Processing complete!")
         
         if all_voters:
-            st.success(f"🎉 Successfully extracted {len(all_voters)} total voter records!")
+            st.success(f"🎉 Successfully extracted {count_records(all_voters)} total voter records!")
             
             # Create Excel file in memory
             status_text.text("Generating Excel file...")
-            excel_buffer = create_excel_file(all_voters)
-            
-            if excel_buffer:
+            try:
+                excel_buffer = create_excel_file(all_voters)
+            except Exception as e:
+                st.error(f"❌ Failed to generate Excel file: {str(e)}")
+            else:
                 # Download button
                 st.download_button(
                     label="📥 Download Excel File",
@@ -155,65 +186,118 @@ def extract_data(uploaded_files):
                 
                 # Display sample data
                 display_sample_data(all_voters)
-            else:
-                st.error("❌ Failed to generate Excel file")
         else:
             st.error("❌ No data was extracted from any of the uploaded files")
     
     except Exception as e:
         st.error(f"❌ Unexpected error: {str(e)}")
         st.exception(e)
+    
+    finally:
+        # Clean up temporary files
+        for tmp_file_path in tmp_files:
+            try:
+                os.unlink(tmp_file_path)
+            except OSError:
+                pass
 
+def count_records(columns):
+    """Count the records held in field -> values columns"""
+    return len(next(iter(columns.values()), []))
+
+def concat_columns(parts):
+    """Concatenate per-file columns, filling fields a file lacks with ''"""
+    fields = dict.fromkeys(field for part in parts for field in part)
+    columns = {field: [] for field in fields}
+    for part in parts:
+        count = count_records(part)
+        for field, values in columns.items():
+            values.extend(part.get(field) or [''] * count)
+    return columns
+
+# Workbooks can be large, so only the last few are kept, and not for long.
+# Failures raise rather than return, so they are never cached.
+@st.cache_data(show_spinner=False, max_entries=4, ttl=3600)
 def create_excel_file(voters):
-    """Create Excel file in memory"""
+    """Create Excel file in memory from field -> values columns, returned as a BytesIO"""
+    from io import BytesIO
+    
+    buffer = BytesIO()
+    
     try:
-        import pandas as pd
-        from io import BytesIO
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(voters)
-        
-        # Create Excel file in memory
-        buffer = BytesIO()
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Electoral_Data', index=False)
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+    
+    # Rows are written straight from the columns; no DataFrame is built
+    header = list(voters)
+    rows = zip(*voters.values())
+    
+    if xlsxwriter is not None:
+        # constant_memory flushes each row once the next one starts, so only
+        # one row is held at a time; it needs rows written in order
+        workbook = xlsxwriter.Workbook(buffer, {'constant_memory': True})
+        worksheet = workbook.add_worksheet('Electoral_Data')
+        worksheet.write_row(0, 0, header, workbook.add_format({'bold': True}))
+        for row, values in enumerate(rows, 1):
+            worksheet.write_row(row, 0, values)
+        workbook.close()
+    else:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
         
-        buffer.seek(0)
-        return buffer.getvalue()
+        # Write-only mode streams rows out without keeping Cell objects
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Electoral_Data')
+        header_font = Font(bold=True)
+        header_cells = []
+        for title in header:
+            cell = WriteOnlyCell(worksheet, value=title)
+            cell.font = header_font
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        for values in rows:
+            worksheet.append(values)
+        workbook.save(buffer)
     
-    except Exception as e:
-        st.error(f"Error creating Excel file: {str(e)}")
-        return None
+    # The buffer itself goes to the download button, which reads it
+    # directly; no separate bytes object is made here
+    buffer.seek(0)
+    return buffer
 
 def display_sample_data(voters):
-    """Display sample of extracted data"""
+    """Display sample of extracted data from field -> values columns"""
     if not voters:
         return
     
     st.header("📊 Sample Data Preview")
     
-    # Convert to DataFrame for display
+    # Statistics come straight from the columns; only the preview rows
+    # are turned into a DataFrame
     import pandas as pd
-    df = pd.DataFrame(voters)
     
     # Display basic statistics
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total Records", len(df))
+        st.metric("Total Records", count_records(voters))
     with col2:
-        st.metric("Total Columns", len(df.columns))
+        st.metric("Total Columns", len(voters))
     with col3:
-        unique_booths = df['PART_NO'].nunique() if 'PART_NO' in df.columns else 0
+        unique_booths = len(set(voters.get('part_no', ())) - {''})
         st.metric("Unique Booths", unique_booths)
     
     # Display sample rows
     st.subheader("📋 First 10 Records")
-    st.dataframe(df.head(10), use_container_width=True)
+    st.dataframe(
+        pd.DataFrame({field: values[:10] for field, values in voters.items()}),
+        use_container_width=True
+    )
     
     # Display column information
     with st.expander("ℹ️ Column Information"):
         st.write("**Extracted Columns:**")
-        for col in df.columns:
+        for col in voters:
             st.write(f"- {col}")
 
 if __name__ == "__main__":
@@ -5,13 +5,9 @@ This script creates sample data to demonstrate the output format
 """
 
 import os
-import sys
-import pandas as pd
+import shutil
 from datetime import datetime
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 from src.utils.file_handler import FileHandler
 
 def create_sample_data():
@@ -137,64 +133,9 @@ def main():
         # Also create a final_output.xlsx as required
         final_output_path = os.path.join(os.getcwd(), 'final_output.xlsx')
         
-        df = pd.DataFrame(sample_data)
-        
-        # Define column order matching the screenshot
-        column_order = [
-            'st_code', 'ac_no', 'part_no', 'serial_number', 'house_number',
-            'first_name', 'last_name', 'first_name_vernacular', 'last_name_vernacular',
-            'relation_type', 'relation_name_en', 'relation_last_name_en',
-            'relation_name_vernacular', 'relation_last_name_vernacular',
-            'epic_number', 'gender', 'age'
-        ]
-        
-        # Define column headers matching the screenshot
-        column_headers = {
-            'st_code': 'ST_CODE',
-            'ac_no': 'AC_NO',
-            'part_no': 'PART_NO',
-            'serial_number': 'SLNOINPART',
-            'house_number': 'C_HOUSE_NO',
-            'first_name': 'FM_NAME_EN',
-            'last_name': 'LASTNAME_EN',
-            'first_name_vernacular': 'FM_NAME_V1',
-            'last_name_vernacular': 'LASTNAME_V1',
-            'relation_type': 'RLN_TYPE',
-            'relation_name_en': 'RLN_FM_NM_EN',
-            'relation_last_name_en': 'RLN_L_NM_EN',
-            'relation_name_vernacular': 'RLN_FM_NM_V1',
-            'relation_last_name_vernacular': 'RLN_L_NM_V1',
-            'epic_number': 'EPIC_NO',
-            'gender': 'GENDER',
-            'age': 'AGE'
-        }
-        
-        # Reorder and rename columns
-        df = df.reindex(columns=column_order)
-        df = df.rename(columns=column_headers)
-        
-        # Save final output
-        with pd.ExcelWriter(final_output_path, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Electoral_Data')
-            
-            # Format the worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Electoral_Data']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+        # The workbook save_to_excel just wrote already has the final
+        # column order, headers and widths, so it is copied as is
+        shutil.copyfile(output_file, final_output_path)
         
         print(f"Final output file created: {final_output_path}")
         
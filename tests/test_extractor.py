@@ -4,14 +4,43 @@ Unit tests for the electoral roll extractor
 
 import unittest
 import os
+import shutil
 import tempfile
 from unittest.mock import Mock, patch, MagicMock
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.core.extractor import ElectoralRollExtractor
 from src.utils.file_handler import FileHandler
+from src.utils.result_cache import ResultCache
+
+
+def _write_text_pdf(path, pages):
+    """Write a minimal PDF with one page per list of text lines"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        text = b"".join(b"(" + line.encode('ascii') + b") '" for line in lines)
+        stream = b"BT /F1 10 Tf 14 TL 40 800 Td " + text + b" ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 600 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects))
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+    
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    
+    with open(path, 'wb') as f:
+        f.write(data)
 
 
 class TestElectoralRollExtractor(unittest.TestCase):
@@ -50,6 +79,35 @@ class TestElectoralRollExtractor(unittest.TestCase):
             with self.subTest(epic=epic):
                 self.assertFalse(self.extractor._validate_epic_number(epic))
     
+    def test_validate_epics_batch(self):
+        """Test batch EPIC validation agrees with the single-number check"""
+        epics = ['ABC1234567', 'abc1234567', 'ABC123456', 'ABC1234567\n', '', None, 'ÀBC1234567', 'XYZ0000001']
+        
+        self.assertEqual(
+            self.extractor.validate_epics_batch(epics),
+            [True, False, False, False, False, False, False, True]
+        )
+        
+        # Without NumPy the same answers come from the EPIC regex
+        with patch.dict('sys.modules', {'numpy': None}):
+            self.assertEqual(
+                self.extractor.validate_epics_batch(epics),
+                [True, False, False, False, False, False, False, True]
+            )
+    
+    def test_validate_columns_small_and_large_batches(self):
+        """Test page-sized and file-sized batches validate the same way"""
+        serials = ['1', '', '3', '4', '5']
+        epics = ['ABC1234567', 'ABC1234567', '', 'ABC123456', 'XYZ0000001']
+        ages = ['40', '40', '', '40', '4O']
+        expected = [True, False, True, False, False]
+        
+        self.assertEqual(self.extractor._validate_columns(serials, epics, ages), expected)
+        self.assertEqual(
+            self.extractor._validate_columns(serials * 100, epics * 100, ages * 100),
+            expected * 100
+        )
+    
     def test_parse_header_info(self):
         """Test header information parsing"""
         sample_text = """
@@ -66,9 +124,142 @@ class TestElectoralRollExtractor(unittest.TestCase):
         self.assertEqual(header_info['booth_number'], '456')
         self.assertEqual(header_info['booth_name'], 'प्राथमिक विद्यालय')
     
+    def test_parse_header_info_vidhan_sabha_number(self):
+        """Test the vidhan sabha match fills vidhan_sabha_number alongside ac_no"""
+        cases = [
+            ("AC: 42 - Test Nagar", '42', '42', 'Test Nagar'),
+            ("AC_NO: 7", '7', '7', ''),
+            ("PS: 3 - Govt School", '11', '', '')  # No vidhan sabha line: ac_no keeps its default
+        ]
+        for text, ac_no, number, name in cases:
+            with self.subTest(text=text):
+                header_info = self.extractor.parse_header_info(text)
+                
+                self.assertEqual(header_info['ac_no'], ac_no)
+                self.assertEqual(header_info['vidhan_sabha_number'], number)
+                self.assertEqual(header_info['vidhan_sabha_name'], name)
+    
+    def test_parse_header_info_keeps_case(self):
+        """Test header values keep their case when matched case-insensitively"""
+        for prefix in ('', 'İ\n'):  # 'İ' grows when lower-cased
+            with self.subTest(prefix=prefix):
+                header_info = self.extractor.parse_header_info(
+                    prefix + "STATE: Uttar Pradesh\nPolling Station: 7 - Govt School"
+                )
+                
+                self.assertEqual(header_info['state_name'], 'Uttar Pradesh')
+                self.assertEqual(header_info['part_no'], '7')
+                self.assertEqual(header_info['booth_name'], 'Govt School')
+    
+    def test_iter_from_text_patterns(self):
+        """Test text parsing dispatches each line to the pattern that matched"""
+        sample_text = (
+            "1 1 Samsudin Ansari समसुद्दीन अंसारी F Israil Ansari इसरायल अंसारी ZIQ1306695 M 39\n"
+            "2 5 Ram Kumar F Shyam Kumar ABC1234567 M 40\n"
+            "3 Sita Devi Rani XYZ7654321 F 33\n"
+            "Electoral roll header line without a record\n"
+        )
+        
+        voters = list(self.extractor._iter_from_text(sample_text, {}))
+        
+        self.assertEqual([v['serial_number'] for v in voters], ['1', '2', '3'])
+        self.assertEqual(voters[0]['relation_name_vernacular'], 'इसरायल')
+        self.assertEqual(voters[1]['house_number'], '5')
+        self.assertEqual(voters[1]['relation_name_en'], 'Shyam')
+        self.assertEqual(voters[1]['epic_number'], 'ABC1234567')
+        self.assertEqual(voters[2]['last_name'], 'Devi Rani')
+    
+    def test_iter_from_text_unicode_spaces(self):
+        """Test fields separated by NBSP or other non-newline spaces still parse, one record per line"""
+        sample_text = (
+            "4\xa0Sita Devi XYZ7654321 F 33\n"
+            "\u20035\u2002Ram\u00a0Kumar ABC1234567\tM 40\n"
+            "6 Split Across\nABC1234567 M 40\n"
+        )
+        
+        voters = list(self.extractor._iter_from_text(sample_text, {}))
+        
+        self.assertEqual([v['serial_number'] for v in voters], ['4', '5'])
+        self.assertEqual(voters[0]['epic_number'], 'XYZ7654321')
+        self.assertEqual(voters[1]['first_name'], 'Ram')
+    
+    def _page_voters(self, mock_pdf_open, tables, header_info):
+        """Run tables through the per-page parser as the only page of a mocked PDF"""
+        page = Mock()
+        page.extract_tables.return_value = tables
+        
+        mock_pdf = MagicMock()
+        mock_pdf.pages = [page]
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf_open.return_value = mock_pdf
+        
+        pages = list(self.extractor._iter_page_voters("dummy.pdf", header_info))
+        self.assertEqual(len(pages), 1)
+        return page, pages[0]
+    
+    @patch('src.core.extractor._load_pymupdf', return_value=None)
+    @patch('pdfplumber.open')
+    def test_page_voters_from_tables(self, mock_pdf_open, mock_load_pymupdf):
+        """Test table rows are mapped, validated and preferred over text"""
+        valid_row = ['', '', '', '1', '12', 'Ram', 'Kumar', '', '', 'F', 'Shyam', 'Kumar', '', '', 'ABC1234567', 'M', '40']
+        bad_epic_row = valid_row[:14] + ['1234567890'] + valid_row[15:]
+        short_row = ['1', '2', '3']
+        
+        page, voters = self._page_voters(
+            mock_pdf_open, [[valid_row, bad_epic_row], [short_row, None]], {'st_code': 'S01'}
+        )
+        
+        self.assertEqual(len(voters), 1)
+        self.assertEqual(voters[0]['st_code'], 'S01')
+        self.assertEqual(voters[0]['serial_number'], '1')
+        self.assertEqual(voters[0]['house_number'], '12')
+        self.assertEqual(voters[0]['epic_number'], 'ABC1234567')
+        self.assertEqual(voters[0]['age'], '40')
+        page.extract_text.assert_not_called()
+    
+    @patch('src.core.extractor._load_pymupdf', return_value=None)
     @patch('pdfplumber.open')
-    def test_extract_text_from_pdf_success(self, mock_pdf_open):
+    def test_page_voters_from_table_header(self, mock_pdf_open, mock_load_pymupdf):
+        """Test table columns are located by the header row when present"""
+        header_row = ['EPIC_NO', 'SLNOINPART', 'FM_NAME_EN', 'AGE']
+        rows = [
+            header_row,
+            ['ABC1234567', '1', 'Ram', '40'],
+            header_row,
+            ['XYZ7654321', '2', 'Sita', '33'],
+            ['', 'Page 2', 'Prepared by', ''],  # Footer table
+            ['', '3']  # Too short to hold every column
+        ]
+        
+        _, voters = self._page_voters(mock_pdf_open, [rows], {})
+        
+        self.assertEqual([v['serial_number'] for v in voters], ['1', '2'])
+        self.assertEqual([v['epic_number'] for v in voters], ['ABC1234567', 'XYZ7654321'])
+        self.assertEqual(voters[1]['first_name'], 'Sita')
+        self.assertEqual(voters[1]['age'], '33')
+        self.assertEqual(voters[1]['gender'], '')
+    
+    @patch('src.core.extractor._load_pymupdf')
+    def test_extract_text_from_pdf_success(self, mock_load_pymupdf):
         """Test successful PDF text extraction"""
+        mock_page = Mock()
+        mock_page.get_text.return_value = "Sample text from page"
+        
+        mock_doc = MagicMock()
+        mock_doc.__enter__.return_value = mock_doc
+        mock_doc.pages.return_value = [mock_page]
+        mock_load_pymupdf.return_value.open.return_value = mock_doc
+        
+        result = self.extractor.extract_text_from_pdf("dummy.pdf")
+        
+        self.assertEqual(result, "Sample text from page\n")
+        mock_load_pymupdf.return_value.open.assert_called_once_with("dummy.pdf")
+        mock_page.get_text.assert_called_once_with("text")
+    
+    @patch('src.core.extractor._load_pymupdf')
+    @patch('pdfplumber.open')
+    def test_extract_text_from_pdf_pdfplumber_backend(self, mock_pdf_open, mock_load_pymupdf):
+        """Test text extraction with the pdfplumber backend requested"""
         # Mock PDF structure
         mock_page = Mock()
         mock_page.extract_text.return_value = "Sample text from page"
@@ -80,13 +271,81 @@ class TestElectoralRollExtractor(unittest.TestCase):
         
         mock_pdf_open.return_value = mock_pdf
         
-        result = self.extractor.extract_text_from_pdf("dummy.pdf")
+        result = self.extractor.extract_text_from_pdf("dummy.pdf", backend='pdfplumber')
         
         self.assertEqual(result, "Sample text from page\n")
         mock_pdf_open.assert_called_once_with("dummy.pdf")
+        mock_load_pymupdf.assert_not_called()
     
+    @patch('src.core.extractor._load_pymupdf', return_value=None)
     @patch('pdfplumber.open')
-    def test_extract_text_from_pdf_failure(self, mock_pdf_open):
+    def test_process_single_pdf_pages(self, mock_pdf_open, mock_load_pymupdf):
+        """Test PDFs are parsed page by page with the header taken from page one"""
+        first_page = Mock()
+        first_page.bbox = (0, 0, 600, 800)
+        first_page.crop.return_value.extract_text.return_value = "AC: 42 - Test Nagar"
+        first_page.extract_text.return_value = "AC: 42 - Test Nagar\n3 Sita Devi Rani XYZ7654321 F 33"
+        first_page.extract_tables.return_value = []
+        
+        second_page = Mock()
+        second_page.extract_tables.return_value = [[
+            ['', '', '', '4', '12', 'Ram', 'Kumar', '', '', 'F', 'Shyam', 'Kumar', '', '', 'ABC1234567', 'M', '40']
+        ]]
+        
+        mock_pdf = MagicMock()
+        mock_pdf.pages = [first_page, second_page]
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf_open.return_value = mock_pdf
+        
+        voters = self.extractor.process_single_pdf("dummy.pdf")
+        
+        self.assertEqual([v['serial_number'] for v in voters], ['3', '4'])
+        self.assertEqual([v['ac_no'] for v in voters], ['42', '42'])
+        second_page.extract_text.assert_not_called()
+    
+    @patch('src.core.extractor._load_pymupdf', return_value=None)
+    @patch('pdfplumber.open')
+    def test_process_single_pdf_header_band(self, mock_pdf_open, mock_load_pymupdf):
+        """Test the header is read from the top band of page one when it holds every field"""
+        page = Mock()
+        page.bbox = (0, 0, 600, 800)
+        page.crop.return_value.extract_text.return_value = (
+            "State: Uttar Pradesh\nAC: 42 - Test Nagar\nPS: 7 - Govt School"
+        )
+        page.extract_tables.return_value = [[
+            ['', '', '', '4', '12', 'Ram', 'Kumar', '', '', 'F', 'Shyam', 'Kumar', '', '', 'ABC1234567', 'M', '40']
+        ]]
+        
+        mock_pdf = MagicMock()
+        mock_pdf.pages = [page]
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf_open.return_value = mock_pdf
+        
+        voters = self.extractor.process_single_pdf("dummy.pdf")
+        
+        self.assertEqual([(v['ac_no'], v['part_no']) for v in voters], [('42', '7')])
+        page.crop.assert_called_once_with((0, 0, 600, 120.0))
+        page.extract_text.assert_not_called()
+    
+    def test_process_single_pdf_columns(self):
+        """Test records are returned as columns, padded where a record lacks a field"""
+        records = [
+            {'serial_number': '1', 'first_name': 'Ram', 'gender': 'M'},
+            {'serial_number': '2', 'first_name': 'Sita'}
+        ]
+        
+        with patch.object(self.extractor, 'iter_pdf_voters', return_value=iter(records)):
+            columns = self.extractor.process_single_pdf_columns("dummy.pdf")
+        
+        self.assertEqual(columns, {
+            'serial_number': ['1', '2'],
+            'first_name': ['Ram', 'Sita'],
+            'gender': ['M', '']
+        })
+    
+    @patch('src.core.extractor._load_pymupdf', return_value=None)
+    @patch('pdfplumber.open')
+    def test_extract_text_from_pdf_failure(self, mock_pdf_open, mock_load_pymupdf):
         """Test PDF text extraction failure"""
         mock_pdf_open.side_effect = Exception("PDF read error")
         
@@ -122,6 +381,56 @@ class TestFileHandler(unittest.TestCase):
         finally:
             os.unlink(temp_path)
     
+    def test_validate_input_path_nested_directory(self):
+        """Test input path validation finds PDFs in subdirectories"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            nested_dir = os.path.join(temp_dir, 'booth', 'part1')
+            os.makedirs(nested_dir)
+            
+            self.assertFalse(FileHandler.validate_input_path(temp_dir))
+            
+            with open(os.path.join(nested_dir, 'roll.PDF'), 'w') as f:
+                f.write("dummy content")
+            
+            self.assertTrue(FileHandler.validate_input_path(temp_dir))
+    
+    def test_validate_output_path(self):
+        """Test output path validation for existing and new paths"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertTrue(FileHandler.validate_output_path(temp_dir))
+            self.assertTrue(FileHandler.validate_output_path(os.path.join(temp_dir, 'new.xlsx')))
+            self.assertFalse(FileHandler.validate_output_path(os.path.join(temp_dir, 'missing', 'new.xlsx')))
+    
+    def test_save_to_excel_creates_directory_once(self):
+        """Test the output directory is only created on the first save"""
+        data = [{'part_no': '7', 'voter_name': 'A'}]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, 'new', 'out.xlsx')
+            
+            with patch('os.makedirs', wraps=os.makedirs) as mock_makedirs:
+                FileHandler.save_to_excel(data, output_file)
+                FileHandler.save_to_excel(data, output_file)
+                mock_makedirs.assert_called_once()
+            
+            self.assertTrue(os.path.isfile(output_file))
+            FileHandler.invalidate()
+            self.assertEqual(FileHandler._created_dirs, set())
+    
+    def test_validate_input_path_caches_empty_directory(self):
+        """Test repeated validation of a folder without PDFs skips the directory walk"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertFalse(FileHandler.validate_input_path(temp_dir))
+            
+            with patch('os.scandir') as mock_scandir:
+                self.assertFalse(FileHandler.validate_input_path(temp_dir))
+                mock_scandir.assert_not_called()
+            
+            with open(os.path.join(temp_dir, 'roll.pdf'), 'w') as f:
+                f.write("dummy content")
+            
+            self.assertTrue(FileHandler.validate_input_path(temp_dir))
+    
     def test_generate_output_filename(self):
         """Test output filename generation"""
         sample_data = [{
@@ -136,11 +445,85 @@ class TestFileHandler(unittest.TestCase):
         
         self.assertEqual(filename, expected)
     
+    def test_generate_output_filename_collapses_separators(self):
+        """Test output filename generation collapses runs of separators"""
+        sample_data = [{
+            'part_no': '7',
+            'booth_name': 'Govt. School - Room (3)',
+            'ac_no': '11',
+            'st_code': 'S04'
+        }]
+        
+        filename = FileHandler.generate_output_filename(sample_data)
+        
+        self.assertEqual(filename, '7_Govt._School_-_Room_3_11_S04.xlsx')
+    
     def test_generate_output_filename_empty_data(self):
         """Test output filename generation with empty data"""
         filename = FileHandler.generate_output_filename([])
         self.assertEqual(filename, 'electoral_data.xlsx')
     
+    def test_normalize_inputs(self):
+        """Test input path normalization from strings and sequences"""
+        self.assertEqual(
+            FileHandler.normalize_inputs(" a.pdf; b.pdf ;;a.pdf"),
+            ['a.pdf', 'b.pdf']
+        )
+        self.assertEqual(
+            FileHandler.normalize_inputs([None, 'dir', ' c.pdf ']),
+            ['dir', 'c.pdf']
+        )
+    
+    def test_save_to_excel_streaming(self):
+        """Test saving batches of records as they arrive"""
+        batches = [
+            [{'part_no': '7', 'voter_name': 'A'}],
+            [],
+            [{'part_no': '7', 'voter_name': 'B'}, {'part_no': '7', 'voter_name': 'C'}]
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, 'out.xlsx')
+            self.assertEqual(FileHandler.save_to_excel_streaming(iter(batches), output_file), output_file)
+            
+            from openpyxl import load_workbook
+            rows = list(load_workbook(output_file).active.values)
+            self.assertEqual(len(rows), 4)
+            self.assertEqual([row[2] for row in rows[1:]], ['7', '7', '7'])
+        
+        self.assertIsNone(FileHandler.save_to_excel_streaming(iter([]), 'unused.xlsx'))
+    
+    def test_save_to_excel_streaming_failure_keeps_output(self):
+        """Test a stream that fails partway leaves the previous output untouched"""
+        def failing_batches():
+            yield [{'part_no': '7', 'voter_name': 'A'}]
+            raise RuntimeError("parse error")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, 'out.xlsx')
+            with open(output_file, 'w') as f:
+                f.write("previous")
+            
+            self.assertIsNone(FileHandler.save_to_excel_streaming(failing_batches(), output_file))
+            
+            with open(output_file) as f:
+                self.assertEqual(f.read(), "previous")
+            self.assertEqual(os.listdir(temp_dir), ['out.xlsx'])
+    
+    def test_save_to_excel_after_output_dir_removed(self):
+        """Test a removed output folder is created again on the next save"""
+        data = [{'part_no': '7', 'serial_number': '1'}]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = os.path.join(temp_dir, 'out')
+            self.assertTrue(FileHandler.validate_output_path(output_dir))
+            self.assertIsNotNone(FileHandler.save_to_excel(data, output_dir))
+            
+            shutil.rmtree(output_dir)
+            
+            self.assertTrue(FileHandler.validate_output_path(output_dir))
+            self.assertIsNotNone(FileHandler.save_to_excel(data, output_dir))
+    
     def test_get_pdf_files_single_file(self):
         """Test getting PDF files from single file path"""
         with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
@@ -169,6 +552,146 @@ class TestFileHandler(unittest.TestCase):
             # Should only return PDF files, sorted
             expected = sorted([pdf1, pdf2])
             self.assertEqual(pdf_files, expected)
+    
+    def test_get_pdf_files_with_sizes(self):
+        """Test getting PDF files with their sizes, largest first"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            small = os.path.join(temp_dir, 'a.pdf')
+            large = os.path.join(temp_dir, 'b.pdf')
+            
+            with open(small, 'w') as f:
+                f.write("x")
+            with open(large, 'w') as f:
+                f.write("x" * 100)
+            
+            self.assertEqual(
+                FileHandler.get_pdf_files_with_sizes(temp_dir),
+                [(small, 1), (large, 100)]
+            )
+            
+            # Later calls reuse the cached scan instead of walking the tree again
+            with patch('src.utils.file_handler._walk_pdf_entries') as mock_walk:
+                self.assertEqual(
+                    FileHandler.get_pdf_files_with_sizes(temp_dir, largest_first=True),
+                    [(large, 100), (small, 1)]
+                )
+            mock_walk.assert_not_called()
+    
+    def test_scan_cache_detects_changes(self):
+        """Test cached directory scans are refreshed when the tree changes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sub_dir = os.path.join(temp_dir, 'sub')
+            os.makedirs(sub_dir)
+            pdf1 = os.path.join(temp_dir, 'file1.pdf')
+            with open(pdf1, 'w') as f:
+                f.write("dummy content")
+            
+            self.assertEqual(FileHandler.scan(temp_dir), [pdf1])
+            
+            with patch('os.scandir') as mock_scandir:
+                self.assertEqual(FileHandler.scan(temp_dir), [pdf1])
+                mock_scandir.assert_not_called()
+            
+            # A file added to a subfolder leaves the root mtime unchanged
+            pdf2 = os.path.join(sub_dir, 'file2.pdf')
+            with open(pdf2, 'w') as f:
+                f.write("dummy content")
+            self.assertEqual(FileHandler.scan(temp_dir), sorted([pdf1, pdf2]))
+            
+            FileHandler.invalidate()
+            self.assertEqual(FileHandler._scan_cache, {})
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for ResultCache class"""
+    
+    def test_load_returns_stored_records_until_file_changes(self):
+        """Test cached records are returned only while the PDF is unchanged"""
+        voters = [{'serial_number': '1', 'first_name': 'राम'}]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, 'roll.pdf')
+            with open(pdf_path, 'w') as f:
+                f.write("dummy content")
+            
+            with patch.dict(os.environ, {'ELECTORAL_EXTRACTOR_CACHE': os.path.join(temp_dir, 'cache')}):
+                self.assertIsNone(ResultCache.load(pdf_path))
+                
+                ResultCache.store(pdf_path, voters)
+                self.assertEqual(ResultCache.load(pdf_path), voters)
+                
+                with open(pdf_path, 'a') as f:
+                    f.write("more content")
+                self.assertIsNone(ResultCache.load(pdf_path))
+    
+    def test_load_requires_same_backend(self):
+        """Test records cached with one PDF reader are not served for another"""
+        voters = [{'serial_number': '1'}]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, 'roll.pdf')
+            with open(pdf_path, 'w') as f:
+                f.write("dummy content")
+            
+            with patch.dict(os.environ, {'ELECTORAL_EXTRACTOR_CACHE': os.path.join(temp_dir, 'cache')}):
+                ResultCache.store(pdf_path, voters, 'pdfplumber 0.11.0')
+                
+                self.assertEqual(ResultCache.load(pdf_path, 'pdfplumber 0.11.0'), voters)
+                self.assertIsNone(ResultCache.load(pdf_path, 'pymupdf 1.24.0'))
+
+
+class TestParallelExtraction(unittest.TestCase):
+    """Test parsing with worker processes gives the same records as a single process"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.extractor = ElectoralRollExtractor(use_cache=False)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+    
+    def _write_roll(self, name, page_count, first_serial=1):
+        """Write a roll of two voter lines per page, with the header on page one"""
+        serials = iter(range(first_serial, first_serial + 2 * page_count))
+        pages = [
+            [f"{serial} Ram Kumar ABC{serial:07d} {'MF'[serial % 2]} {20 + serial % 60}"
+             for serial in (next(serials), next(serials))]
+            for _ in range(page_count)
+        ]
+        pages[0].insert(0, f"AC: 42 - {name}")
+        
+        path = os.path.join(self.temp_dir.name, name + '.pdf')
+        _write_text_pdf(path, pages)
+        return path
+    
+    def test_iter_voters_workers_match_serial(self):
+        """Test files parsed by a process pool keep their records and path order"""
+        # Sizes differ so the largest-first submission order is not path order
+        for name, page_count, first_serial in (('a', 1, 1), ('b', 3, 101), ('c', 2, 201)):
+            self._write_roll(name, page_count, first_serial)
+        
+        serial = list(self.extractor.iter_voters(self.temp_dir.name, workers=1))
+        parallel = list(self.extractor.iter_voters(self.temp_dir.name, workers=3))
+        
+        self.assertEqual(len(serial), 12)
+        self.assertEqual([v['serial_number'] for v in serial[:3]], ['1', '2', '101'])
+        self.assertEqual(parallel, serial)
+        
+        # A pending window smaller than the folder still keeps path order
+        with patch('src.core.extractor._PENDING_PER_WORKER', 1):
+            self.assertEqual(list(self.extractor.iter_voters(self.temp_dir.name, workers=2)), serial)
+    
+    def test_page_ranges_workers_match_serial(self):
+        """Test a roll split across processes by page range keeps its records and page order"""
+        path = self._write_roll('roll', 2 * 16 + 1)
+        
+        serial = list(self.extractor.iter_pdf_voters(path, workers=1))
+        batches = list(self.extractor._iter_page_voters_parallel(path, workers=2))
+        
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(serial), 66)
+        self.assertEqual({v['ac_no'] for v in serial}, {'42'})
+        self.assertEqual([voter for batch in batches for voter in batch], serial)
+        self.assertEqual(list(self.extractor.iter_voters(path, workers=2)), serial)
 
 
 if __name__ == '__main__':